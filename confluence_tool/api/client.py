@@ -1,18 +1,63 @@
 """Confluence API client implementation."""
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 import logging
+import re
+import shutil
+import socket
+import threading
 import time
-from typing import Dict, List, Any, Optional, Union
-from urllib.parse import urljoin, quote
+from typing import BinaryIO, Dict, Iterator, List, Any, Optional, Tuple, Union
+from urllib.parse import urljoin, quote, unquote
 import json
 
 logger = logging.getLogger(__name__)
 
+# Extracts the cursor token from a v2 API "_links.next" URL
+_CURSOR_RE = re.compile(r'[?&]cursor=([^&]+)')
+
+# TCP keepalive options so pooled connections survive long idle gaps (e.g.
+# between pagination batches on multi-hour exports).  TCP_KEEPIDLE/KEEPINTVL/
+# KEEPCNT are not available on every platform, so only include what exists.
+_KEEPALIVE_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)] + [
+    (socket.IPPROTO_TCP, getattr(socket, name), value)
+    for name, value in (('TCP_KEEPIDLE', 60), ('TCP_KEEPINTVL', 30), ('TCP_KEEPCNT', 3))
+    if hasattr(socket, name)
+]
+
+# Connections kept per host.  urllib3's default of 10 is below the worker
+# counts people configure, and a full pool discards connections, forcing a
+# fresh TCP + TLS handshake on the next request.
+_POOL_MAXSIZE = 64
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that enables TCP keepalive on pooled connections."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        # Keep urllib3's defaults (TCP_NODELAY) alongside the keepalive options
+        kwargs.setdefault(
+            'socket_options',
+            list(HTTPConnection.default_socket_options) + _KEEPALIVE_SOCKET_OPTIONS
+        )
+        super().init_poolmanager(*args, **kwargs)
+
 
 class ConfluenceAPIClient:
     """Robust Confluence REST API client with error handling and rate limiting."""
     
+    # Default expansions for space content listings
+    SPACE_CONTENT_EXPAND = 'version,space,body.storage,ancestors,children,descendants,metadata.labels,restrictions'
+    
+    # Space content expansions that also inline each page's attachments and
+    # comments, so exporters don't need per-page listing requests
+    SPACE_CONTENT_EXPORT_EXPAND = (
+        SPACE_CONTENT_EXPAND + ',children.attachment.version,children.attachment.metadata'
+        ',children.comment.body.view,children.comment.version'
+    )
+    
     def __init__(self, base_url: str, username: str, auth_token: str = None, 
                  password: str = None, timeout: int = 30, max_retries: int = 3,
                  rate_limit: float = 10.0):
@@ -32,7 +77,13 @@ class ConfluenceAPIClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.rate_limit = rate_limit
-        self._last_request_time = 0
+        # Next permitted request slot (time.monotonic() seconds).  Guarded by
+        # _bucket_lock so concurrent worker threads reserve distinct slots.
+        self._next_request_time = 0.0
+        self._bucket_lock = threading.Lock()
+        # Display names resolved via get_user_display_name, keyed by
+        # (identifier type, value); None records a failed lookup
+        self._display_names: Dict[Tuple[str, str], Optional[str]] = {}
 
         # Detect if this is a Confluence Cloud instance (atlassian.net domain)
         # Cloud instances require /wiki/rest/api/ path, while Server/Data Center use /rest/api/
@@ -63,20 +114,38 @@ class ConfluenceAPIClient:
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json',
+            # Page bodies compress well.  requests' default already offers
+            # gzip/deflate, plus br/zstd when their decoders are installed,
+            # and decodes responses (including streamed downloads)
+            # transparently; keep it explicit so it isn't lost if the
+            # defaults above are ever replaced wholesale.
+            'Accept-Encoding': requests.utils.DEFAULT_ACCEPT_ENCODING,
             'User-Agent': 'Confluence-Export-Import-Tool/1.0'
         })
+        # One session and connection pool shared by all worker threads
+        adapter = _KeepAliveAdapter(pool_maxsize=_POOL_MAXSIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def _rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        if self.rate_limit > 0:
-            time_since_last = time.time() - self._last_request_time
-            min_interval = 1.0 / self.rate_limit
-            
-            if time_since_last < min_interval:
-                sleep_time = min_interval - time_since_last
-                time.sleep(sleep_time)
-        
-        self._last_request_time = time.time()
+        """Apply rate limiting between requests.
+
+        Safe to call from multiple threads: each caller atomically reserves
+        the next free request slot under a lock, then sleeps (outside the
+        lock) until that slot arrives.
+        """
+        if self.rate_limit <= 0:
+            return
+
+        min_interval = 1.0 / self.rate_limit
+        with self._bucket_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_time)
+            self._next_request_time = slot + min_interval
+        
+        sleep_time = slot - now
+        if sleep_time > 0:
+            time.sleep(sleep_time)
     
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make HTTP request with retries and error handling.
@@ -98,7 +167,7 @@ class ConfluenceAPIClient:
             try:
                 self._rate_limit()
                 
-                logger.debug(f"Making {method} request to {url} (attempt {attempt + 1})")
+                logger.debug("Making %s request to %s (attempt %d)", method, url, attempt + 1)
                 
                 response = self.session.request(
                     method=method,
@@ -144,21 +213,23 @@ class ConfluenceAPIClient:
             except requests.exceptions.HTTPError as e:
                 if response.status_code in [401, 403]:
                     raise  # Don't retry auth errors
-                # Log response body for debugging
-                try:
-                    error_body = response.text
-                    logger.warning(f"HTTP error {response.status_code} on attempt {attempt + 1}: {e}")
-                    if error_body:
-                        logger.debug(f"Response body: {error_body}")
-                except:
-                    logger.warning(f"HTTP error {response.status_code} on attempt {attempt + 1}: {e}")
+                logger.warning(f"HTTP error {response.status_code} on attempt {attempt + 1}: {e}")
+                # Log response body for debugging (decoding .text is skipped
+                # entirely unless DEBUG is enabled)
+                if logger.isEnabledFor(logging.DEBUG):
+                    try:
+                        error_body = response.text
+                        if error_body:
+                            logger.debug("Response body: %s", error_body)
+                    except Exception:
+                        pass
                 if attempt == self.max_retries:
                     raise
             
             # Wait before retry (exponential backoff)
             if attempt < self.max_retries:
                 wait_time = (2 ** attempt) * 1.0
-                logger.debug(f"Waiting {wait_time} seconds before retry...")
+                logger.debug("Waiting %s seconds before retry...", wait_time)
                 time.sleep(wait_time)
         
         raise requests.exceptions.RequestException("Max retries exceeded")
@@ -196,7 +267,7 @@ class ConfluenceAPIClient:
             url = urljoin(f"{self.base_url}{api_path}", probe_endpoint)
             try:
                 self._rate_limit()
-                logger.debug(f"Testing connection: GET {url}")
+                logger.debug("Testing connection: GET %s", url)
                 response = self.session.get(url, timeout=self.timeout)
                 response.raise_for_status()
 
@@ -257,6 +328,28 @@ class ConfluenceAPIClient:
         
         return data.get('results', [])
     
+    def get_space_by_key(self, space_key: str) -> Optional[Dict[str, Any]]:
+        """Look up a single space by key without listing every space.
+        
+        Args:
+            space_key: Space key
+        
+        Returns:
+            Space dictionary, or None if the space doesn't exist or isn't
+            visible to the current user
+        """
+        params = {
+            'spaceKey': space_key,
+            'limit': 1,
+            'expand': 'description,homepage,metadata.labels'
+        }
+        
+        response = self._make_request('GET', 'space', params=params)
+        for space in response.json().get('results', []):
+            if space.get('key') == space_key:
+                return space
+        return None
+    
     def get_all_spaces(self) -> List[Dict[str, Any]]:
         """Get all Confluence spaces using pagination.
         
@@ -275,13 +368,14 @@ class ConfluenceAPIClient:
             all_spaces.extend(spaces)
             start += limit
             
-            logger.debug(f"Retrieved {len(all_spaces)} spaces so far...")
+            logger.debug("Retrieved %d spaces so far...", len(all_spaces))
         
         logger.info(f"Retrieved {len(all_spaces)} total spaces")
         return all_spaces
     
     def get_space_content(self, space_key: str, content_type: str = 'page', 
-                         limit: int = 50, start: int = 0) -> List[Dict[str, Any]]:
+                         limit: int = 50, start: int = 0,
+                         expand: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get content from a specific space.
         
         Args:
@@ -289,48 +383,81 @@ class ConfluenceAPIClient:
             content_type: Type of content (page, blogpost, etc.)
             limit: Maximum number of items to return
             start: Starting index for pagination
+            expand: Comma-separated properties to expand (defaults to
+                    SPACE_CONTENT_EXPAND)
         
         Returns:
             List of content dictionaries
         """
+        return self._get_space_content_page(space_key, content_type, limit, start,
+                                            expand).get('results', [])
+    
+    def _get_space_content_page(self, space_key: str, content_type: str, limit: int,
+                                start: int, expand: Optional[str]) -> Dict[str, Any]:
+        """Fetch one page of a space content listing as the raw response dict."""
         endpoint = f"space/{space_key}/content/{content_type}"
         params = {
             'limit': limit,
             'start': start,
-            'expand': 'version,space,body.storage,ancestors,children,descendants,metadata.labels,restrictions'
+            'expand': expand or self.SPACE_CONTENT_EXPAND
         }
         
         response = self._make_request('GET', endpoint, params=params)
-        data = response.json()
-        
-        return data.get('results', [])
+        return response.json()
     
-    def get_all_space_content(self, space_key: str, content_type: str = 'page') -> List[Dict[str, Any]]:
+    def get_all_space_content(self, space_key: str, content_type: str = 'page',
+                              expand: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get all content from a space using pagination.
         
         Args:
             space_key: Space key
             content_type: Type of content (page, blogpost, etc.)
+            expand: Comma-separated properties to expand (defaults to
+                    SPACE_CONTENT_EXPAND)
         
         Returns:
             List of all content dictionaries
         """
-        all_content = []
+        all_content = list(self.iter_space_content(space_key, content_type, expand))
+        logger.info(f"Retrieved {len(all_content)} total {content_type}s from space {space_key}")
+        return all_content
+    
+    def iter_space_content(self, space_key: str, content_type: str = 'page',
+                           expand: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over all content in a space, fetching it page by page.
+        
+        Each listing page is only requested once the caller has consumed the
+        previous one, so work can start on the first results without holding
+        the whole space in memory.
+        
+        Args:
+            space_key: Space key
+            content_type: Type of content (page, blogpost, etc.)
+            expand: Comma-separated properties to expand (defaults to
+                    SPACE_CONTENT_EXPAND)
+        
+        Yields:
+            Content dictionaries
+        """
         start = 0
         limit = 50
         
         while True:
-            content = self.get_space_content(space_key, content_type, limit=limit, start=start)
+            data = self._get_space_content_page(space_key, content_type, limit, start, expand)
+            content = data.get('results', [])
             if not content:
                 break
             
-            all_content.extend(content)
-            start += limit
+            # Advance by what was returned: the server may cap the page size
+            start += len(content)
             
-            logger.debug(f"Retrieved {len(all_content)} {content_type}s from space {space_key}")
-        
-        logger.info(f"Retrieved {len(all_content)} total {content_type}s from space {space_key}")
-        return all_content
+            logger.debug("Retrieved %d %ss from space %s", start, content_type, space_key)
+            yield from content
+            
+            # A short page with no next link is the last one; skip the extra
+            # request that would only come back empty
+            if len(content) < data.get('limit', limit) and not data.get('_links', {}).get('next'):
+                break
     
     def get_page_attachments(self, page_id: str) -> List[Dict[str, Any]]:
         """Get attachments for a specific page.
@@ -367,7 +494,50 @@ class ConfluenceAPIClient:
             Example transformations:
             - /download/attachments/123/file.png -> /wiki/download/attachments/123/file.png (Cloud)
             - /download/attachments/123/file.png -> /download/attachments/123/file.png (Server/DC)
+            
+            Prefer download_attachment_stream for large files.
+        """
+        return b''.join(self.download_attachment_stream(download_url))
+    
+    def download_attachment_stream(self, download_url: str,
+                                   chunk_size: int = 1 << 16) -> Iterator[bytes]:
+        """Download attachment content in chunks without holding it in memory.
+        
+        The request is retried like download_attachment until the response
+        headers arrive; errors while reading the body are raised to the caller.
+        
+        Args:
+            download_url: Download URL from attachment's _links.download field
+            chunk_size: Maximum size of each yielded chunk in bytes
+        
+        Yields:
+            Successive chunks of the attachment content
         """
+        response = self._open_attachment_download(self._attachment_url(download_url))
+        with response:
+            yield from response.iter_content(chunk_size)
+    
+    def download_attachment_to(self, download_url: str, fileobj: BinaryIO,
+                               buffer_size: int = 1 << 20) -> None:
+        """Download attachment content into a writable binary file object.
+        
+        The response body is copied straight from the socket in large reads
+        with shutil.copyfileobj, without building per-chunk Python objects
+        for the caller.
+        
+        Args:
+            download_url: Download URL from attachment's _links.download field
+            fileobj: Destination opened in binary write mode
+            buffer_size: Read size used for the copy
+        """
+        response = self._open_attachment_download(self._attachment_url(download_url))
+        with response:
+            # Undo any Content-Encoding (gzip etc.) while copying
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, fileobj, buffer_size)
+    
+    def _attachment_url(self, download_url: str) -> str:
+        """Turn an attachment _links.download value into an absolute URL."""
         # Check if download_url is a relative path
         if download_url.startswith('/'):
             # For Cloud instances, prepend /wiki to the download path
@@ -380,17 +550,25 @@ class ConfluenceAPIClient:
             # It's already a full URL
             full_url = download_url
         
-        logger.debug(f"Downloading attachment from: {full_url}")
-        
+        logger.debug("Downloading attachment from: %s", full_url)
+        return full_url
+    
+    def _open_attachment_download(self, full_url: str) -> requests.Response:
+        """Start a streamed attachment download with retry logic."""
         # Make the request with authentication and retry logic
         for attempt in range(self.max_retries + 1):
             try:
                 self._rate_limit()
                 
-                response = self.session.get(full_url, timeout=self.timeout, allow_redirects=True)
-                response.raise_for_status()
+                response = self.session.get(full_url, timeout=self.timeout,
+                                            allow_redirects=True, stream=True)
+                try:
+                    response.raise_for_status()
+                except requests.exceptions.HTTPError:
+                    response.close()
+                    raise
                 
-                return response.content
+                return response
                 
             except requests.exceptions.Timeout:
                 logger.warning(f"Attachment download timeout on attempt {attempt + 1}: {full_url}")
@@ -406,11 +584,48 @@ class ConfluenceAPIClient:
             # Wait before retry (exponential backoff)
             if attempt < self.max_retries:
                 wait_time = (2 ** attempt) * 1.0
-                logger.debug(f"Waiting {wait_time} seconds before retry...")
+                logger.debug("Waiting %s seconds before retry...", wait_time)
                 time.sleep(wait_time)
         
         raise requests.exceptions.RequestException(f"Max retries exceeded for attachment download: {full_url}")
     
+    def get_user_display_name(self, user: Dict[str, Any]) -> Optional[str]:
+        """Resolve a user's display name, fetching it only once per user.
+        
+        Used when a content response's ``by`` object lacks displayName.
+        Results (including failed lookups) are cached for the lifetime of
+        the client.
+        
+        Args:
+            user: User object from a content response (version.by etc.)
+        
+        Returns:
+            Display name, or None if it cannot be resolved
+        """
+        if user.get('displayName'):
+            return user['displayName']
+        
+        # Cloud identifies users by accountId; Server/DC by userKey/username
+        for field, param in (('accountId', 'accountId'), ('userKey', 'key'), ('username', 'username')):
+            if user.get(field):
+                cache_key = (param, user[field])
+                break
+        else:
+            return None
+        
+        if cache_key in self._display_names:
+            return self._display_names[cache_key]
+        
+        try:
+            response = self._make_request('GET', 'user', params={cache_key[0]: cache_key[1]})
+            display_name = response.json().get('displayName')
+        except Exception as e:
+            logger.debug("Could not resolve display name for %s=%s: %s", cache_key[0], cache_key[1], e)
+            display_name = None
+        
+        self._display_names[cache_key] = display_name
+        return display_name
+    
     def get_page_comments(self, page_id: str) -> List[Dict[str, Any]]:
         """Get comments for a specific page.
         
@@ -522,7 +737,7 @@ class ConfluenceAPIClient:
         
         # Log sanitization for debugging problematic filenames
         if original_filename != sanitized_filename:
-            logger.debug(f"Upload: Sanitized filename '{original_filename}' -> '{sanitized_filename}'")
+            logger.debug("Upload: Sanitized filename '%s' -> '%s'", original_filename, sanitized_filename)
         
         files = {
             'file': (sanitized_filename, open(file_path, 'rb'), mime_type),
@@ -584,7 +799,8 @@ class ConfluenceAPIClient:
             }
         }
         
-        logger.debug(f"Creating space with data: {json.dumps(data, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Creating space with data: %s", json.dumps(data, indent=2))
         response = self._make_request('POST', 'space', json=data)
         logger.info(f"Created new space: {space_name} ({space_key})")
         return response.json()
@@ -625,11 +841,12 @@ class ConfluenceAPIClient:
         logger.info(f"Updated space: {space_key}")
         return response.json()
     
-    def get_space(self, space_key: str) -> Dict[str, Any]:
+    def get_space(self, space_key: str, expand: str = 'description,homepage') -> Dict[str, Any]:
         """Get details of a specific space.
         
         Args:
             space_key: Space key
+            expand: Comma-separated properties to expand
         
         Returns:
             Space dictionary
@@ -638,7 +855,7 @@ class ConfluenceAPIClient:
             requests.exceptions.RequestException: On request failure
         """
         response = self._make_request('GET', f'space/{space_key}', 
-                                     params={'expand': 'description,homepage'})
+                                     params={'expand': expand})
         return response.json()
     
     def delete_page(self, page_id: str) -> bool:
@@ -680,7 +897,7 @@ class ConfluenceAPIClient:
             self._rate_limit()
             response = self.session.delete(endpoint_url, timeout=self.timeout)
             if response.status_code == 404:
-                logger.debug(f"Folder {folder_id} not found (already deleted)")
+                logger.debug("Folder %s not found (already deleted)", folder_id)
                 return True
             response.raise_for_status()
             logger.info(f"Deleted folder with ID: {folder_id}")
@@ -766,8 +983,6 @@ class ConfluenceAPIClient:
         Returns:
             List of folder dicts (id, title, parentId, parentType, …)
         """
-        from urllib.parse import urlparse, parse_qs
-
         v2_base = self.base_url + ('/wiki/api/v2/' if self.is_cloud else '/api/v2/')
 
         # ------------------------------------------------------------------ #
@@ -805,8 +1020,8 @@ class ConfluenceAPIClient:
                 if not next_link:
                     break
                 if isinstance(next_link, str) and '?' in next_link:
-                    parsed = urlparse(next_link)
-                    cursor = parse_qs(parsed.query).get('cursor', [None])[0]
+                    m = _CURSOR_RE.search(next_link)
+                    cursor = unquote(m.group(1)) if m else None
                 else:
                     cursor = next_link if isinstance(next_link, str) else None
                 if not cursor:
@@ -860,10 +1075,10 @@ class ConfluenceAPIClient:
                             queue.append(parent_id)
                 else:
                     logger.debug(
-                        f"Could not fetch folder {folder_id}: HTTP {response.status_code}"
+                        "Could not fetch folder %s: HTTP %s", folder_id, response.status_code
                     )
             except Exception as e:
-                logger.debug(f"Error fetching folder {folder_id}: {e}")
+                logger.debug("Error fetching folder %s: %s", folder_id, e)
 
         logger.info(f"Discovered {len(all_folders)} folder(s) in space {space_id}")
         return list(all_folders.values())
@@ -891,8 +1106,6 @@ class ConfluenceAPIClient:
         Returns:
             List of folder dicts, or [] if all strategies are unavailable.
         """
-        from urllib.parse import urlparse, parse_qs
-
         def _paginate(params: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
             """Fetch all pages for the given params.
 
@@ -925,8 +1138,8 @@ class ConfluenceAPIClient:
                 next_link = data.get('_links', {}).get('next')
                 if not next_link:
                     break
-                parsed = urlparse(next_link) if isinstance(next_link, str) else None
-                cursor = parse_qs(parsed.query).get('cursor', [None])[0] if parsed else None
+                m = _CURSOR_RE.search(next_link) if isinstance(next_link, str) else None
+                cursor = unquote(m.group(1)) if m else None
                 if not cursor:
                     break
             return results
@@ -1075,7 +1288,7 @@ class ConfluenceAPIClient:
         
         try:
             self._rate_limit()
-            logger.debug(f"Creating folder '{folder_name}' in space {space_id}")
+            logger.debug("Creating folder '%s' in space %s", folder_name, space_id)
             
             response = self.session.post(
                 endpoint_url,
@@ -1125,7 +1338,7 @@ class ConfluenceAPIClient:
         endpoint = f"content/{content_id}/move/{position}/{target_id}"
         try:
             self._rate_limit()
-            logger.debug(f"Moving content {content_id} to {position} {target_id}")
+            logger.debug("Moving content %s to %s %s", content_id, position, target_id)
             response = self._make_request('PUT', endpoint)
             logger.info(f"Moved content {content_id} under target {target_id}")
             return True
@@ -1206,10 +1419,10 @@ class ConfluenceAPIClient:
                     all_databases[db_id] = response.json()
                 else:
                     logger.debug(
-                        f"Could not fetch database {db_id}: HTTP {response.status_code}"
+                        "Could not fetch database %s: HTTP %s", db_id, response.status_code
                     )
             except Exception as e:
-                logger.debug(f"Error fetching database {db_id}: {e}")
+                logger.debug("Error fetching database %s: %s", db_id, e)
 
         logger.info(f"Discovered {len(all_databases)} database(s) in space {space_id}")
         return list(all_databases.values())
@@ -1250,7 +1463,7 @@ class ConfluenceAPIClient:
 
         try:
             self._rate_limit()
-            logger.debug(f"Creating database '{title}' in space {space_id}")
+            logger.debug("Creating database '%s' in space %s", title, space_id)
 
             response = self.session.post(
                 endpoint_url,
@@ -1,16 +1,226 @@
 """Configuration manager for the Confluence tool."""
 
+import copy
+import functools
 import os
+import pickle
+import re
+import shutil
 import yaml
-from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import logging
 
+try:
+    from functools import cached_property
+except ImportError:  # Python 3.7
+    class cached_property:  # type: ignore[no-redef]
+        """Minimal stand-in for functools.cached_property."""
+
+        def __init__(self, func):
+            self.func = func
+            self.attrname = func.__name__
+            self.__doc__ = func.__doc__
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = instance.__dict__[self.attrname] = self.func(instance)
+            return value
+
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it; it parses
+# several times faster than the pure-Python SafeLoader.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _SafeLoader
+
+# Parsed and validated configs keyed by (abspath, mtime_ns, size), so the same
+# unchanged file is only parsed once per process.  Entries are shared by every
+# ConfigManager for that file and must never be mutated.
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+# Per-process constants for the default config search locations
+_CWD_CONFIG_NAME = "config.yaml"
+_HOME_CONFIG = os.path.join(os.path.expanduser("~"), ".confluence_tool_config.yaml")
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# The package's config.yaml doubles as the sample config
+_SAMPLE_CONFIG_PATH = os.path.join(_PACKAGE_DIR, _CWD_CONFIG_NAME)
+# Whether _SAMPLE_CONFIG_PATH exists; checked once by create_sample_config
+_SAMPLE_CONFIG_EXISTS: Optional[bool] = None
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_default_config(cwd: str) -> Optional[str]:
+    """Return the first existing default config path for the given cwd."""
+    for candidate in (os.path.join(cwd, _CWD_CONFIG_NAME), _HOME_CONFIG, _SAMPLE_CONFIG_PATH):
+        try:
+            os.stat(candidate)
+            return candidate
+        except OSError:
+            continue
+    return None
+
+
+# Opt-in on-disk cache of validated configs (<config>.pkl next to the file),
+# so separate CLI invocations can skip YAML parsing.  Off by default because
+# the sidecar holds credentials and unpickling trusts the file's contents.
+_PICKLE_CACHE_ENABLED = os.environ.get("CONFLUENCE_TOOL_PICKLE_CACHE", "") == "1"
+
+
+def _read_pickle_sidecar(sidecar: str, fingerprint: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+    """Return the config stored in a sidecar if it matches the fingerprint."""
+    try:
+        with open(sidecar, 'rb') as f:
+            stored_fingerprint, config = pickle.load(f)
+    except Exception:
+        return None
+    if stored_fingerprint != fingerprint or not isinstance(config, dict):
+        return None
+    return config
+
+
+def _write_pickle_sidecar(sidecar: str, fingerprint: Tuple[int, int], config: Dict[str, Any]) -> None:
+    """Atomically write a validated config to its sidecar, ignoring failures."""
+    tmp_path = f"{sidecar}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((fingerprint, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, sidecar)
+    except Exception as e:
+        logger.debug("Could not write config cache %s: %s", sidecar, e)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+_MISSING = object()
+
+# Fast path for configs written in a plain subset of YAML: nested
+# "key: scalar" mappings with comments.  Anything outside that subset
+# (lists, anchors, block scalars, flow collections, escapes, YAML 1.1
+# yes/no/on/off booleans...) makes _parse_simple_yaml give up so the file
+# goes through the real YAML parser instead.
+_SIMPLE_LINE = re.compile(r'( *)([A-Za-z_][\w.-]*):(?: +(.*))?$')
+_SIMPLE_VALUE = re.compile(
+    r'(?:"([^"\\]*)"|\'([^\']*)\'|([^\s#\'"][^\s#]*))?(?:(?:^|\s+)#.*|\s*)$'
+)
+_SIMPLE_INT = re.compile(r'-?(?:0|[1-9][0-9]*)$')
+_SIMPLE_FLOAT = re.compile(r'-?[0-9]+\.[0-9]+$')
+_SIMPLE_PLAIN = re.compile(r'[A-Za-z](?:[\w./@+:-]*[\w./@+-])?$')
+_SIMPLE_CONSTANTS = {
+    'true': True, 'True': True, 'TRUE': True,
+    'false': False, 'False': False, 'FALSE': False,
+    'null': None, 'Null': None, 'NULL': None, '~': None,
+}
+# Words YAML resolves to something other than a string
+_SIMPLE_RESERVED = frozenset(_SIMPLE_CONSTANTS).union(
+    'yes Yes YES no No NO on On ON off Off OFF'.split()
+)
+
+
+def _parse_simple_scalar(raw: str) -> Any:
+    """Convert a single scalar from the simple subset, or return _MISSING."""
+    m = _SIMPLE_VALUE.match(raw)
+    if m is None:
+        return _MISSING
+    double, single, plain = m.groups()
+    if double is not None:
+        return double
+    if single is not None:
+        return single
+    if plain is None:
+        return None
+    if plain in _SIMPLE_CONSTANTS:
+        return _SIMPLE_CONSTANTS[plain]
+    if _SIMPLE_INT.match(plain):
+        return int(plain)
+    if _SIMPLE_FLOAT.match(plain):
+        return float(plain)
+    if plain in _SIMPLE_RESERVED or not _SIMPLE_PLAIN.match(plain):
+        return _MISSING
+    return plain
+
+
+def _parse_simple_yaml(data: bytes) -> Optional[Dict[str, Any]]:
+    """Parse a config written in the simple YAML subset.
+
+    Returns:
+        The parsed mapping, or None if the document uses anything outside the
+        subset and must be handed to the YAML parser.
+    """
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+    if '\t' in text:
+        return None
+
+    root: Dict[str, Any] = {}
+    stack = [(0, root)]  # (indent, mapping) for each open nesting level
+    pending = None  # (indent, mapping, key) for a key whose value was empty
+    for line in text.splitlines():
+        stripped = line.lstrip(' ')
+        if not stripped or stripped[0] == '#':
+            continue
+        m = _SIMPLE_LINE.match(line)
+        if m is None:
+            return None
+        indent = len(m.group(1))
+        key = m.group(2)
+        if key in _SIMPLE_RESERVED:
+            return None
+
+        if pending is not None:
+            pending_indent, parent, pending_key = pending
+            pending = None
+            if indent > pending_indent:
+                child: Dict[str, Any] = {}
+                parent[pending_key] = child
+                stack.append((indent, child))
+        while indent < stack[-1][0]:
+            stack.pop()
+        if indent != stack[-1][0]:
+            return None
+
+        mapping = stack[-1][1]
+        raw = m.group(3) or ''
+        value = _parse_simple_scalar(raw)
+        if value is _MISSING:
+            return None
+        mapping[key] = value
+        if not raw or raw[0] == '#':
+            # Empty value: null, unless a nested mapping follows
+            pending = (indent, mapping, key)
+    return root or None
+
+
+# Top-level sections every config file must define (ordered for error messages)
+_REQUIRED_SECTION_ORDER = ('confluence', 'export', 'import', 'general')
+_REQUIRED_SECTIONS = frozenset(_REQUIRED_SECTION_ORDER)
+
+# (predicate, error message) pairs checked in order by _validate_config.
+# Each predicate receives the full config dict.
+_CONFIG_CHECKS = (
+    (lambda c: c['confluence'].get('base_url'),
+     "Confluence base_url is required"),
+    (lambda c: 'auth' in c['confluence'],
+     "Confluence auth configuration is required"),
+    (lambda c: c['confluence']['auth'].get('username'),
+     "Confluence username is required"),
+    (lambda c: c['confluence']['auth'].get('api_token') or c['confluence']['auth'].get('password'),
+     "Either api_token or password is required for authentication"),
+)
+
 
 class ConfigManager:
     """Manages configuration loading and validation."""
+
+    # Dotted keys already split into path tuples, shared by all instances
+    _KEY_SPLIT_CACHE: Dict[str, Tuple[str, ...]] = {}
     
     def __init__(self, config_path: Optional[str] = None):
         """Initialize configuration manager.
@@ -20,7 +230,30 @@ class ConfigManager:
                         in current directory, then user home directory.
         """
         self.config_path = self._find_config_path(config_path)
-        self.config = self._load_config()
+        # Parsed config shared by every manager loaded from the same file.
+        # It is never mutated; callers get private copies via _section().
+        self._shared_config = self._load_config()
+        # Sections copied out of _shared_config on first access
+        self._sections: Dict[str, Any] = {}
+        self._config: Optional[Dict[str, Any]] = None
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Full configuration dictionary (copies every section on first use)."""
+        if self._config is None:
+            self._config = {name: self._section(name) for name in self._shared_config}
+        return self._config
+
+    def _section(self, name: str) -> Any:
+        """Return this manager's private copy of a top-level section.
+
+        Sections are deep-copied out of the shared parsed config lazily, so a
+        command that only needs one section never copies the others.
+        """
+        section = self._sections.get(name, _MISSING)
+        if section is _MISSING:
+            section = self._sections[name] = copy.deepcopy(self._shared_config[name])
+        return section
     
     @classmethod
     def create_multi_env_manager(cls, source_config: Optional[str] = None, 
@@ -37,53 +270,97 @@ class ConfigManager:
         source_manager = cls(source_config) if source_config else None
         target_manager = cls(target_config) if target_config else None
         return source_manager, target_manager
-    
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Discard all cached parsed configuration files."""
+        _CONFIG_CACHE.clear()
+
     def _find_config_path(self, config_path: Optional[str]) -> str:
         """Find configuration file path."""
         if config_path:
             # If a specific path is provided, it must exist
-            if os.path.exists(config_path):
+            try:
+                os.stat(config_path)
                 return config_path
-            else:
+            except OSError:
                 raise FileNotFoundError(
                     f"Specified configuration file not found: {config_path}\n"
                     f"Please check the path and try again."
                 )
         
-        # Search in current directory first
-        current_dir_config = os.path.join(os.getcwd(), "config.yaml")
-        if os.path.exists(current_dir_config):
-            return current_dir_config
-        
-        # Then in user home directory
-        home_config = os.path.join(Path.home(), ".confluence_tool_config.yaml")
-        if os.path.exists(home_config):
-            return home_config
-        
-        # Finally, try the package directory
-        package_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        package_config = os.path.join(package_dir, "config.yaml")
-        if os.path.exists(package_config):
-            return package_config
-        
+        # Search the current directory, then the user home directory, then the
+        # package directory.  The winner is cached per working directory.
+        cwd = os.getcwd()
+        found = _resolve_default_config(cwd)
+        if found:
+            return found
+
+        # Don't remember misses: a config may be created later in this process
+        _resolve_default_config.cache_clear()
         raise FileNotFoundError(
             "Configuration file not found. Please create config.yaml in:\n"
-            f"  - Current directory: {current_dir_config}\n"
-            f"  - Home directory: {home_config}\n"
+            f"  - Current directory: {os.path.join(cwd, _CWD_CONFIG_NAME)}\n"
+            f"  - Home directory: {_HOME_CONFIG}\n"
             f"  - Or specify path with --config option"
         )
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
+        """Load configuration from YAML file.
+
+        Parsed configs are cached per (path, mtime, size) and the returned
+        dict is shared between managers, so it must be treated as read-only.
+        """
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            # One open + fstat + read; the fstat result also keys the caches
+            fd = os.open(self.config_path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+            try:
+                st = os.fstat(fd)
+                if st.st_size == 0:
+                    raise ValueError("Configuration file is empty")
+                cache_key = (os.path.abspath(self.config_path), st.st_mtime_ns, st.st_size)
+                cached = _CONFIG_CACHE.get(cache_key)
+                if cached is not None:
+                    return cached
+
+                fingerprint = (st.st_mtime_ns, st.st_size)
+                sidecar = self.config_path + '.pkl'
+                if _PICKLE_CACHE_ENABLED:
+                    # Sidecars are only ever written after validation
+                    config = _read_pickle_sidecar(sidecar, fingerprint)
+                    if config is not None:
+                        _CONFIG_CACHE[cache_key] = config
+                        return config
+
+                data = os.read(fd, st.st_size)
+                while len(data) < st.st_size:
+                    chunk = os.read(fd, st.st_size - len(data))
+                    if not chunk:
+                        break
+                    data += chunk
+            finally:
+                os.close(fd)
+
+            # Catch obviously wrong files before the YAML parser builds an error
+            if data.startswith(b'\xef\xbb\xbf'):
+                data = data[3:]
+            head = data[:256]
+            if head.lstrip()[:1] in (b'<', b'{') and b':' not in head:
+                raise ValueError("File looks like XML/JSON, not YAML")
+
+            config = _parse_simple_yaml(data)
+            if config is None:
+                # libyaml accepts bytes directly, skipping a Python-side decode
+                config = yaml.load(data, Loader=_SafeLoader)
             
             if not config:
                 raise ValueError("Configuration file is empty")
             
             # Validate required sections
             self._validate_config(config)
+            _CONFIG_CACHE[cache_key] = config
+            if _PICKLE_CACHE_ENABLED:
+                _write_pickle_sidecar(sidecar, fingerprint, config)
             return config
             
         except yaml.YAMLError as e:
@@ -93,26 +370,15 @@ class ConfigManager:
     
     def _validate_config(self, config: Dict[str, Any]) -> None:
         """Validate configuration structure."""
-        required_sections = ['confluence', 'export', 'import', 'general']
-        
-        for section in required_sections:
-            if section not in config:
-                raise ValueError(f"Missing required configuration section: {section}")
+        missing = _REQUIRED_SECTIONS - config.keys()
+        if missing:
+            section = next(s for s in _REQUIRED_SECTION_ORDER if s in missing)
+            raise ValueError(f"Missing required configuration section: {section}")
         
         # Validate Confluence connection settings
-        confluence_config = config['confluence']
-        if 'base_url' not in confluence_config or not confluence_config['base_url']:
-            raise ValueError("Confluence base_url is required")
-        
-        if 'auth' not in confluence_config:
-            raise ValueError("Confluence auth configuration is required")
-        
-        auth_config = confluence_config['auth']
-        if not auth_config.get('username'):
-            raise ValueError("Confluence username is required")
-        
-        if not auth_config.get('api_token') and not auth_config.get('password'):
-            raise ValueError("Either api_token or password is required for authentication")
+        for check, message in _CONFIG_CHECKS:
+            if not check(config):
+                raise ValueError(message)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation.
@@ -124,35 +390,69 @@ class ConfigManager:
         Returns:
             Configuration value or default
         """
-        keys = key.split('.')
-        value = self.config
-        
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
+        parts = self._KEY_SPLIT_CACHE.get(key)
+        if parts is None:
+            parts = self._KEY_SPLIT_CACHE.setdefault(key, tuple(key.split('.')))
+
+        # Walk this manager's own section copies, never the shared parsed
+        # config, so callers can't edit what other managers see
+        if parts[0] not in self._shared_config:
             return default
+        value = self._section(parts[0])
+        for k in parts[1:]:
+            if not isinstance(value, dict):
+                return default
+            value = value.get(k, _MISSING)
+            if value is _MISSING:
+                return default
+        return value
     
+    @cached_property
+    def confluence(self) -> Dict[str, Any]:
+        """Confluence connection configuration."""
+        return self._section('confluence')
+
+    @cached_property
+    def export(self) -> Dict[str, Any]:
+        """Export configuration."""
+        return self._section('export')
+
+    @cached_property
+    def import_(self) -> Dict[str, Any]:
+        """Import configuration."""
+        return self._section('import')
+
+    @cached_property
+    def general(self) -> Dict[str, Any]:
+        """General configuration."""
+        return self._section('general')
+
+    @cached_property
+    def logging(self) -> Dict[str, Any]:
+        """Logging configuration (empty if the file has no logging section)."""
+        if 'logging' not in self._shared_config:
+            return {}
+        return self._section('logging')
+
     def get_confluence_config(self) -> Dict[str, Any]:
         """Get Confluence connection configuration."""
-        return self.config['confluence']
+        return self.confluence
     
     def get_export_config(self) -> Dict[str, Any]:
         """Get export configuration."""
-        return self.config['export']
+        return self.export
     
     def get_import_config(self) -> Dict[str, Any]:
         """Get import configuration."""
-        return self.config['import']
+        return self.import_
     
     def get_general_config(self) -> Dict[str, Any]:
         """Get general configuration."""
-        return self.config['general']
+        return self.general
     
     def get_logging_config(self) -> Dict[str, Any]:
         """Get logging configuration."""
-        return self.config.get('logging', {})
+        return self.logging
     
     def create_sample_config(self, path: str) -> None:
         """Create a sample configuration file.
@@ -160,12 +460,13 @@ class ConfigManager:
         Args:
             path: Path where to create the sample config file
         """
-        package_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        sample_config_path = os.path.join(package_dir, "config.yaml")
+        global _SAMPLE_CONFIG_EXISTS
+        if _SAMPLE_CONFIG_EXISTS is None:
+            _SAMPLE_CONFIG_EXISTS = os.path.isfile(_SAMPLE_CONFIG_PATH)
         
-        if os.path.exists(sample_config_path):
-            import shutil
-            shutil.copy2(sample_config_path, path)
+        if _SAMPLE_CONFIG_EXISTS:
+            # Contents only; the sample's timestamps and mode aren't needed
+            shutil.copyfile(_SAMPLE_CONFIG_PATH, path)
             logger.info(f"Sample configuration created at: {path}")
         else:
             raise FileNotFoundError("Sample configuration file not found in package")
\ No newline at end of file
@@ -1,12 +1,17 @@
 """Confluence space exporter implementation."""
 
 import os
+import html
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional, Sized
 from datetime import datetime
 import concurrent.futures
+import itertools
+import re
+import shutil
+import threading
 from tqdm import tqdm
 
 from ..api.client import ConfluenceAPIClient
@@ -17,19 +22,167 @@ from ..utils.helpers import (
 
 logger = logging.getLogger(__name__)
 
+# orjson is an optional, much faster serializer for the export's JSON files
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Machine-read export metadata is written compactly; listings for big spaces
+# (folders, attachments, comments) run to megabytes.
+_COMPACT_SEPARATORS = (',', ':')
+
+# Written to each export so a later incremental export can reuse unchanged
+# attachments instead of downloading them again
+_MANIFEST_FILENAME = 'manifest.json'
+
+# Static HTML wrappers, formatted once per page/comment with str.format
+_PAGE_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; line-height: 1.6; margin: 40px; }}
+        .page-title {{ color: #333; border-bottom: 2px solid #ddd; padding-bottom: 10px; }}
+        .page-content {{ margin-top: 20px; }}
+        .metadata {{ background-color: #f5f5f5; padding: 10px; border-radius: 5px; margin-top: 20px; font-size: 0.9em; }}
+    </style>
+</head>
+<body>
+    <h1 class="page-title">{title}</h1>
+    <div class="page-content">
+        {body}
+    </div>
+    <div class="metadata">
+        <strong>Page ID:</strong> {page_id}<br>
+        <strong>Space:</strong> {space_key}<br>
+        <strong>Version:</strong> {version}<br>
+        <strong>Created:</strong> {created}<br>
+        <strong>Author:</strong> {author}
+    </div>
+</body>
+</html>"""
+
+_COMMENTS_HTML_PREFIX = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Comments for: {page_title}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; line-height: 1.6; margin: 40px; }}
+        .comment {{ border: 1px solid #ddd; margin: 10px 0; padding: 15px; border-radius: 5px; }}
+        .comment-author {{ font-weight: bold; color: #333; }}
+        .comment-date {{ color: #666; font-size: 0.9em; }}
+        .comment-content {{ margin-top: 10px; }}
+    </style>
+</head>
+<body>
+    <h1>Comments for: {page_title}</h1>
+"""
+
+_COMMENT_HTML_TEMPLATE = """
+    <div class="comment">
+        <div class="comment-author">{author}</div>
+        <div class="comment-date">{date}</div>
+        <div class="comment-content">{content}</div>
+    </div>
+"""
+
+_COMMENTS_HTML_SUFFIX = """
+</body>
+</html>"""
+
+_SUMMARY_HTML_STYLE = """    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; margin: 40px; }
+        .summary-header { color: #333; border-bottom: 2px solid #ddd; padding-bottom: 10px; }
+        .section { margin: 20px 0; }
+        .stats { background-color: #f5f5f5; padding: 15px; border-radius: 5px; }
+        .error { color: #d32f2f; }
+        .success { color: #388e3c; }
+    </style>
+"""
+
+
+def _encode_json(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes.
+
+    Args:
+        obj: JSON-serializable object
+        pretty: Indent by two spaces (for files meant to be read by people)
+
+    Returns:
+        Encoded JSON
+    """
+    data = None
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            data = orjson.dumps(obj, option=option)
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles those
+            data = None
+    if data is None:
+        if pretty:
+            text = json.dumps(obj, indent=2, ensure_ascii=False)
+        else:
+            text = json.dumps(obj, separators=_COMPACT_SEPARATORS, ensure_ascii=False)
+        data = text.encode('utf-8')
+    return data
+
+
+def _dump_json(obj: Any, path: str, pretty: bool = False) -> None:
+    """Write obj to path as UTF-8 JSON.
+
+    Args:
+        obj: JSON-serializable object
+        path: Output file path
+        pretty: Indent by two spaces (for files meant to be read by people)
+    """
+    # Serialized up front, so this is a single write call
+    data = _encode_json(obj, pretty)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _make_leaf_dir(path: str) -> None:
+    """Create a directory whose parent normally exists already.
+
+    One mkdir syscall in the common case, instead of the stat + mkdir that
+    os.makedirs(exist_ok=True) costs; falls back to makedirs if the parent
+    is missing.
+    """
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)
+
+
+def _attachment_tmp_path(file_path: str) -> str:
+    """Temporary sibling of file_path, unique to the calling thread."""
+    return f"{file_path}.{threading.get_ident()}.tmp"
+
 
 class ConfluenceExporter:
     """Robust Confluence space exporter with comprehensive error handling."""
     
-    def __init__(self, client: ConfluenceAPIClient, export_config: Dict[str, Any]):
+    def __init__(self, client: ConfluenceAPIClient, export_config: Dict[str, Any],
+                 max_workers: Optional[int] = None):
         """Initialize exporter.
         
         Args:
             client: Confluence API client
             export_config: Export configuration dictionary
+            max_workers: Number of pages exported concurrently (typically
+                        general.max_workers); export.max_workers overrides it
         """
         self.client = client
         self.config = export_config
+        self.max_workers = export_config.get('max_workers', max_workers or 5)
         self.export_stats = {
             'pages_exported': 0,
             'folders_exported': 0,
@@ -40,6 +193,13 @@ class ConfluenceExporter:
             'start_time': None,
             'end_time': None
         }
+        # Versions exported in this run: pages {id: version} and attachments
+        # {id: {'version': n, 'path': path relative to the export dir}}
+        self._manifest: Dict[str, Dict[str, Any]] = {'pages': {}, 'attachments': {}}
+        # Attachments from the previous export's manifest (incremental mode)
+        self._prev_attachments: Dict[str, Dict[str, Any]] = {}
+        self._prev_export_dir: Optional[str] = None
+        self._export_dir: Optional[str] = None
     
     def export_space(self, space_key: str) -> str:
         """Export a complete Confluence space.
@@ -59,38 +219,47 @@ class ConfluenceExporter:
         try:
             # Create export directory structure
             export_dir = self._create_export_directory(space_key)
+            self._export_dir = export_dir
             
-            # Export space metadata
-            space_info = self._export_space_metadata(space_key, export_dir)
-            
-            # Export folders and databases if available (Cloud only via v2 API).
-            # The v2 folders/databases endpoints require the v2-format space ID,
-            # which differs from the legacy integer ID returned by the v1 API.
-            # Fetch the v2 ID explicitly; fall back to v1 ID if unavailable.
-            space_id_v1 = space_info.get('id')
-            space_id_v2 = self.client.get_space_id_v2(space_key)
-            folder_db_space_id = space_id_v2 or space_id_v1
-            if folder_db_space_id:
-                logger.info(
-                    f"Using space ID {folder_db_space_id} for folders/databases "
-                    f"(v1={space_id_v1}, v2={space_id_v2})"
-                )
-                self._export_folders(folder_db_space_id, export_dir)
-                self._export_databases(folder_db_space_id, export_dir)
+            if self.config.get('incremental', False):
+                self._load_previous_manifest(space_key, export_dir)
             
-            # Get all pages in the space
-            pages = self.client.get_all_space_content(space_key, 'page')
-            logger.info(f"Found {len(pages)} pages to export")
+            # The space metadata and v2 space ID requests are independent, so run
+            # them concurrently instead of paying their round-trips in series
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                space_info_future = executor.submit(self._export_space_metadata, space_key, export_dir)
+                space_id_v2_future = executor.submit(self.client.get_space_id_v2, space_key)
+                
+                # Export folders and databases if available (Cloud only via v2 API).
+                # The v2 folders/databases endpoints require the v2-format space ID,
+                # which differs from the legacy integer ID returned by the v1 API.
+                # Fetch the v2 ID explicitly; fall back to v1 ID if unavailable.
+                space_info = space_info_future.result()
+                space_id_v1 = space_info.get('id')
+                space_id_v2 = space_id_v2_future.result()
+                folder_db_space_id = space_id_v2 or space_id_v1
+                if folder_db_space_id:
+                    logger.info(
+                        f"Using space ID {folder_db_space_id} for folders/databases "
+                        f"(v1={space_id_v1}, v2={space_id_v2})"
+                    )
+                    # Not concurrent: get_databases reads the client._v2_page_parents
+                    # map that get_folders resets and refills, so folders go first
+                    self._export_folders(folder_db_space_id, export_dir)
+                    self._export_databases(folder_db_space_id, export_dir)
             
-            # Export pages with progress tracking
-            if pages:
-                self._export_pages(pages, export_dir)
+            # Pages and blog posts are streamed from the listing as they are
+            # exported rather than collected up front
+            expand = self.client.SPACE_CONTENT_EXPORT_EXPAND
+            for content_type in ('page', 'blogpost'):
+                count = self._export_pages(
+                    self.client.iter_space_content(space_key, content_type, expand=expand),
+                    export_dir, content_type=content_type
+                )
+                if count or content_type == 'page':
+                    logger.info(f"Processed {count} {content_type}s from space {space_key}")
             
-            # Export blog posts if they exist
-            blog_posts = self.client.get_all_space_content(space_key, 'blogpost')
-            if blog_posts:
-                logger.info(f"Found {len(blog_posts)} blog posts to export")
-                self._export_pages(blog_posts, export_dir, content_type='blogpost')
+            self._write_manifest(export_dir)
             
             # Create export summary
             self._create_export_summary(export_dir, space_info)
@@ -143,24 +312,18 @@ class ConfluenceExporter:
             Space metadata dictionary
         """
         try:
-            # Get space information
-            spaces = self.client.get_spaces(limit=1, start=0)
-            space_info = None
-            
-            # Find the specific space
-            all_spaces = self.client.get_all_spaces()
-            for space in all_spaces:
-                if space['key'] == space_key:
-                    space_info = space
-                    break
-            
-            if not space_info:
+            # Get space information directly by key (same expansions as the
+            # space listing, so space_info.json keeps its shape)
+            space_info = self.client.get_space(
+                space_key, expand='description,homepage,metadata.labels'
+            )
+            
+            if not space_info or space_info.get('key') != space_key:
                 raise ValueError(f"Space {space_key} not found")
             
             # Save space metadata
             metadata_file = os.path.join(export_dir, 'metadata', 'space_info.json')
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(space_info, f, indent=2, ensure_ascii=False)
+            _dump_json(space_info, metadata_file)
             
             logger.debug(f"Exported space metadata to {metadata_file}")
             return space_info
@@ -193,8 +356,7 @@ class ConfluenceExporter:
             v2_page_parents = getattr(self.client, '_v2_page_parents', {})
             if v2_page_parents:
                 v2_parents_file = os.path.join(export_dir, 'v2_page_parents.json')
-                with open(v2_parents_file, 'w', encoding='utf-8') as f:
-                    json.dump(v2_page_parents, f, indent=2, ensure_ascii=False)
+                _dump_json(v2_page_parents, v2_parents_file)
                 logger.info(
                     f"Saved v2 parent info for {len(v2_page_parents)} pages "
                     f"to {v2_parents_file}"
@@ -210,8 +372,7 @@ class ConfluenceExporter:
             os.makedirs(folders_dir, exist_ok=True)
 
             folders_metadata_file = os.path.join(folders_dir, 'folders_metadata.json')
-            with open(folders_metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(folders, f, indent=2, ensure_ascii=False)
+            _dump_json(folders, folders_metadata_file)
 
             self.export_stats['folders_exported'] = len(folders)
             logger.info(f"Exported {len(folders)} folders to {folders_metadata_file}")
@@ -248,8 +409,7 @@ class ConfluenceExporter:
             os.makedirs(databases_dir, exist_ok=True)
 
             databases_metadata_file = os.path.join(databases_dir, 'databases_metadata.json')
-            with open(databases_metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(databases, f, indent=2, ensure_ascii=False)
+            _dump_json(databases, databases_metadata_file)
 
             self.export_stats['databases_exported'] = len(databases)
 
@@ -264,81 +424,173 @@ class ConfluenceExporter:
             # Don't add to errors — databases may not be available in all instances
             logger.debug(f"Database export error details: {e}", exc_info=True)
 
-    def _export_pages(self, pages: List[Dict[str, Any]], export_dir: str, 
-                     content_type: str = 'page') -> None:
+    def _export_pages(self, pages: Iterable[Dict[str, Any]], export_dir: str, 
+                     content_type: str = 'page') -> int:
         """Export pages with multithreading support.
         
+        Pages are pulled from ``pages`` only as workers free up, so a lazy
+        iterable (see ConfluenceAPIClient.iter_space_content) is consumed
+        while the export is running.
+        
         Args:
-            pages: List of page dictionaries
+            pages: Page dictionaries (a list or any iterable)
             export_dir: Export directory path
             content_type: Type of content (page or blogpost)
+        
+        Returns:
+            Number of pages taken from ``pages``
         """
-        max_workers = self.config.get('max_workers', 5)
+        max_workers = self.max_workers
+        page_iter = iter(pages)
+        first_page = next(page_iter, None)
+        if first_page is None:
+            return 0
+        page_iter = itertools.chain([first_page], page_iter)
+        total = len(pages) if isinstance(pages, Sized) else None
+        submitted = 0
         
         # Create subdirectory for this content type
         content_dir = os.path.join(export_dir, f"{content_type}s")
         os.makedirs(content_dir, exist_ok=True)
+        # Parents of the per-page attachment/comment directories, created once
+        # here so workers only need a single mkdir for pages that have any
+        os.makedirs(os.path.join(export_dir, 'attachments'), exist_ok=True)
+        os.makedirs(os.path.join(content_dir, 'comments'), exist_ok=True)
         
-        # Export pages with progress bar
-        with tqdm(total=len(pages), desc=f"Exporting {content_type}s") as pbar:
+        # Export pages with progress bar (open-ended while the listing is
+        # still being streamed)
+        with tqdm(total=total, desc=f"Exporting {content_type}s", mininterval=0.5) as pbar:
             with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all page export tasks
+                # Keep a couple of pages per worker queued instead of creating
+                # a future for every page of a large space up front
                 future_to_page = {
-                    executor.submit(self._export_single_page, page, content_dir): page 
-                    for page in pages
+                    executor.submit(self._export_single_page, page, content_dir): page
+                    for page in itertools.islice(page_iter, max_workers * 2)
                 }
+                submitted = len(future_to_page)
                 
-                # Process completed tasks
-                for future in concurrent.futures.as_completed(future_to_page):
-                    page = future_to_page[future]
-                    try:
-                        future.result()
-                        self.export_stats['pages_exported'] += 1
-                    except Exception as e:
-                        error_msg = f"Failed to export {content_type} '{page.get('title', 'Unknown')}': {e}"
-                        logger.error(error_msg)
-                        self.export_stats['errors'].append(error_msg)
-                    finally:
-                        pbar.update(1)
+                # Process completed tasks, topping the queue back up as we go
+                while future_to_page:
+                    done, _ = concurrent.futures.wait(
+                        future_to_page, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        page = future_to_page.pop(future)
+                        try:
+                            page_stats = future.result()
+                            self.export_stats['pages_exported'] += 1
+                            self._merge_page_stats(page_stats)
+                        except Exception as e:
+                            error_msg = f"Failed to export {content_type} '{page.get('title', 'Unknown')}': {e}"
+                            logger.error(error_msg)
+                            self.export_stats['errors'].append(error_msg)
+                        finally:
+                            pbar.update(1)
+                        
+                        for next_page in itertools.islice(page_iter, 1):
+                            future_to_page[executor.submit(
+                                self._export_single_page, next_page, content_dir
+                            )] = next_page
+                            submitted += 1
+        
+        return submitted
+    
+    @staticmethod
+    def _new_page_stats() -> Dict[str, Any]:
+        """Return empty counters for the work done exporting one page."""
+        return {'attachments_exported': 0, 'comments_exported': 0, 'errors': []}
     
-    def _export_single_page(self, page: Dict[str, Any], content_dir: str) -> None:
+    def _merge_page_stats(self, page_stats: Dict[str, Any]) -> None:
+        """Fold one page's counters into export_stats (main thread only)."""
+        self.export_stats['attachments_exported'] += page_stats['attachments_exported']
+        self.export_stats['comments_exported'] += page_stats['comments_exported']
+        self.export_stats['errors'].extend(page_stats['errors'])
+    
+    def _export_single_page(self, page: Dict[str, Any], content_dir: str) -> Dict[str, Any]:
         """Export a single page with all its components.
         
+        Worker threads don't touch export_stats; each page's counters are
+        returned and merged by the caller instead.
+        
         Args:
             page: Page dictionary from Confluence API
             content_dir: Directory to save page content
+            
+        Returns:
+            Counters for this page (see _new_page_stats)
         """
         page_id = page['id']
         title = page['title']
+        stats = self._new_page_stats()
         
         try:
-            # Create safe filename
+            # Sanitize the title once; the attachment and comment directories
+            # are named after it too
+            safe_title = sanitize_filename(title)
+            
+            # Create safe filenames; the HTML and metadata files share a stem
             include_id = self.config.get('naming', {}).get('include_page_id', False)
-            filename = get_safe_page_filename(title, page_id, include_id)
-            page_file = os.path.join(content_dir, filename)
+            file_stem = os.path.join(
+                content_dir,
+                get_safe_page_filename(title, page_id, include_id, extension='', safe_title=safe_title)
+            )
+            page_file = file_stem + '.html'
             
             # Export page content as HTML
             if self.config.get('format', {}).get('html', True):
                 self._export_page_html(page, page_file)
             
+            self._manifest['pages'][str(page_id)] = page.get('version', {}).get('number')
+            
             # Export page metadata
-            metadata_file = os.path.join(content_dir, f"{os.path.splitext(filename)[0]}_metadata.json")
-            self._export_page_metadata(page, metadata_file)
+            self._export_page_metadata(page, file_stem + '_metadata.json')
             
             # Export attachments if enabled
             if self.config.get('format', {}).get('attachments', True):
-                self._export_page_attachments(page_id, content_dir, title)
+                self._export_page_attachments(page_id, content_dir, title,
+                                              self._inline_children(page, 'attachment'), stats,
+                                              safe_title)
             
             # Export comments if enabled
             if self.config.get('format', {}).get('comments', True):
-                self._export_page_comments(page_id, content_dir, title)
+                self._export_page_comments(page_id, content_dir, title,
+                                           self._inline_children(page, 'comment'), stats,
+                                           safe_title)
             
             logger.debug(f"Successfully exported page: {title}")
+            return stats
             
         except Exception as e:
             logger.error(f"Error exporting page {title}: {e}")
             raise
     
+    @staticmethod
+    def _inline_children(page: Dict[str, Any], child_type: str) -> Optional[List[Dict[str, Any]]]:
+        """Return attachments/comments expanded inline with a page listing.
+        
+        Args:
+            page: Page dictionary from the space content listing
+            child_type: 'attachment' or 'comment'
+            
+        Returns:
+            The complete list, or None if it wasn't expanded or was truncated
+            and has to be fetched separately
+        """
+        children = page.get('children', {}).get(child_type)
+        if not isinstance(children, dict) or 'results' not in children:
+            return None
+        if children.get('_links', {}).get('next'):
+            return None
+        return children['results']
+    
+    def _author_name(self, user: Dict[str, Any]) -> str:
+        """Display name for a version.by user object.
+        
+        Falls back to a (cached) user lookup when the response omits the
+        display name, e.g. for some comment authors.
+        """
+        return user.get('displayName') or self.client.get_user_display_name(user) or 'Unknown'
+    
     def _export_page_html(self, page: Dict[str, Any], page_file: str) -> None:
         """Export page content as HTML.
         
@@ -351,34 +603,18 @@ class ConfluenceExporter:
         # Get page content
         body_storage = page.get('body', {}).get('storage', {}).get('value', '')
         
-        # Create HTML structure
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; margin: 40px; }}
-        .page-title {{ color: #333; border-bottom: 2px solid #ddd; padding-bottom: 10px; }}
-        .page-content {{ margin-top: 20px; }}
-        .metadata {{ background-color: #f5f5f5; padding: 10px; border-radius: 5px; margin-top: 20px; font-size: 0.9em; }}
-    </style>
-</head>
-<body>
-    <h1 class="page-title">{title}</h1>
-    <div class="page-content">
-        {body_storage}
-    </div>
-    <div class="metadata">
-        <strong>Page ID:</strong> {page['id']}<br>
-        <strong>Space:</strong> {page['space']['key']}<br>
-        <strong>Version:</strong> {page['version']['number']}<br>
-        <strong>Created:</strong> {page['version']['when']}<br>
-        <strong>Author:</strong> {page['version']['by']['displayName']}
-    </div>
-</body>
-</html>"""
+        # Create HTML structure; the body is Confluence storage-format HTML
+        # and is inserted as-is, everything else is escaped
+        version = page['version']
+        html_content = _PAGE_HTML_TEMPLATE.format(
+            title=html.escape(title),
+            body=body_storage,
+            page_id=html.escape(str(page['id'])),
+            space_key=html.escape(str(page['space']['key'])),
+            version=html.escape(str(version['number'])),
+            created=html.escape(str(version['when'])),
+            author=html.escape(str(self._author_name(version.get('by', {})))),
+        )
         
         # Write HTML file
         with open(page_file, 'w', encoding='utf-8') as f:
@@ -399,56 +635,72 @@ class ConfluenceExporter:
             'space': page['space'],
             'version': page['version'],
             'ancestors': page.get('ancestors', []),
-            'children': page.get('children', {}),
+            # Inline attachment/comment listings are exported separately
+            'children': {
+                key: value for key, value in page.get('children', {}).items()
+                if key not in ('attachment', 'comment')
+            },
             'descendants': page.get('descendants', {}),
             'metadata': page.get('metadata', {}),
             'restrictions': page.get('restrictions', {}),
             'export_date': datetime.now().isoformat()
         }
         
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        _dump_json(metadata, metadata_file)
     
-    def _export_page_attachments(self, page_id: str, content_dir: str, page_title: str) -> None:
+    def _export_page_attachments(self, page_id: str, content_dir: str, page_title: str,
+                                 attachments: Optional[List[Dict[str, Any]]] = None,
+                                 stats: Optional[Dict[str, Any]] = None,
+                                 safe_title: Optional[str] = None) -> None:
         """Export attachments for a page.
         
         Args:
             page_id: Page ID
             content_dir: Content directory
             page_title: Page title for directory naming
+            attachments: Attachments already fetched with the page, if any
+            stats: Counters to update (defaults to export_stats)
+            safe_title: sanitize_filename(page_title), if already computed
         """
+        if stats is None:
+            stats = self.export_stats
         try:
-            attachments = self.client.get_page_attachments(page_id)
+            if attachments is None:
+                attachments = self.client.get_page_attachments(page_id)
             
             if not attachments:
                 return
             
             # Create attachments directory for this page
             # content_dir is export_dir/pages, go up one level to get export_dir
-            safe_title = sanitize_filename(page_title)
+            if safe_title is None:
+                safe_title = sanitize_filename(page_title)
             export_dir = os.path.dirname(content_dir)
             attach_dir = os.path.join(export_dir, 'attachments', safe_title)
-            os.makedirs(attach_dir, exist_ok=True)
-            
-            # Download each attachment
-            for attachment in attachments:
-                try:
-                    self._download_attachment(attachment, attach_dir)
-                    self.export_stats['attachments_exported'] += 1
-                except Exception as e:
-                    error_msg = f"Failed to download attachment {attachment.get('title', 'Unknown')}: {e}"
-                    logger.warning(error_msg)
-                    self.export_stats['errors'].append(error_msg)
-            
-            # Save attachments metadata
+            _make_leaf_dir(attach_dir)
+            
+            # Download each attachment, appending its entry to the metadata
+            # array as we go rather than serializing the whole list at the end
             metadata_file = os.path.join(attach_dir, 'attachments_metadata.json')
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(attachments, f, indent=2, ensure_ascii=False)
+            with open(metadata_file, 'wb') as metadata:
+                metadata.write(b'[')
+                for i, attachment in enumerate(attachments):
+                    try:
+                        self._download_attachment(attachment, attach_dir)
+                        stats['attachments_exported'] += 1
+                    except Exception as e:
+                        error_msg = f"Failed to download attachment {attachment.get('title', 'Unknown')}: {e}"
+                        logger.warning(error_msg)
+                        stats['errors'].append(error_msg)
+                    if i:
+                        metadata.write(b',')
+                    metadata.write(_encode_json(attachment))
+                metadata.write(b']')
             
         except Exception as e:
             error_msg = f"Failed to export attachments for page {page_title}: {e}"
             logger.warning(error_msg)
-            self.export_stats['errors'].append(error_msg)
+            stats['errors'].append(error_msg)
     
     def _download_attachment(self, attachment: Dict[str, Any], attach_dir: str) -> None:
         """Download a single attachment.
@@ -473,99 +725,203 @@ class ConfluenceExporter:
             logger.debug(f"  Sanitized filename: '{title}' -> '{safe_filename}'")
         
         file_path = os.path.join(attach_dir, safe_filename)
+        version = attachment.get('version', {}).get('number')
         
-        # Download attachment content using the download URL from Confluence API
-        # The client will handle prepending /wiki for Cloud instances
-        content = self.client.download_attachment(download_url)
+        if self._reuse_previous_attachment(attachment_id, version, file_path):
+            logger.debug("Reused unchanged attachment from previous export: %s (ID: %s)", title, attachment_id)
+        else:
+            self._fetch_attachment(download_url, file_path)
+            logger.debug(f"Successfully downloaded attachment: {title} (ID: {attachment_id})")
         
-        # Write to file
-        with open(file_path, 'wb') as f:
-            f.write(content)
+        if self._export_dir:
+            self._manifest['attachments'][str(attachment_id)] = {
+                'version': version,
+                'path': os.path.relpath(file_path, self._export_dir),
+            }
+    
+    def _fetch_attachment(self, download_url: str, file_path: str) -> None:
+        """Download attachment content to a file.
         
-        logger.debug(f"Successfully downloaded attachment: {title} (ID: {attachment_id})")
+        Args:
+            download_url: Download URL from attachment's _links.download field
+            file_path: Destination file path
+        """
+        # Stream attachment content straight to disk using the download URL
+        # from Confluence API.  The client will handle prepending /wiki for
+        # Cloud instances.  The file is written under a temporary name and
+        # renamed into place: file_path may already be a hard link into the
+        # previous export (two attachments can sanitize to the same name),
+        # and writing through it would overwrite that export's copy.
+        tmp_path = _attachment_tmp_path(file_path)
+        try:
+            with open(tmp_path, 'wb') as f:
+                self.client.download_attachment_to(download_url, f)
+            os.replace(tmp_path, file_path)
+        except Exception:
+            # Don't leave a truncated file behind
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    def _reuse_previous_attachment(self, attachment_id: str, version: Optional[int],
+                                   file_path: str) -> bool:
+        """Link or copy an attachment from the previous export if unchanged.
+        
+        Args:
+            attachment_id: Attachment ID
+            version: Current attachment version number
+            file_path: Destination file path
+            
+        Returns:
+            True if the previous copy was reused
+        """
+        previous = self._prev_attachments.get(str(attachment_id))
+        if not previous or version is None or previous.get('version') != version:
+            return False
+        
+        source = os.path.join(self._prev_export_dir, previous.get('path', ''))
+        if not os.path.isfile(source):
+            return False
+        # Link or copy under a temporary name and rename into place, so an
+        # existing file_path is replaced rather than written through
+        tmp_path = _attachment_tmp_path(file_path)
+        try:
+            try:
+                os.link(source, tmp_path)
+            except OSError:
+                shutil.copyfile(source, tmp_path)
+            os.replace(tmp_path, file_path)
+        except OSError as e:
+            logger.debug("Could not reuse %s: %s", source, e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+        return True
+    
+    def _load_previous_manifest(self, space_key: str, export_dir: str) -> None:
+        """Load the manifest of the most recent earlier export of this space.
+        
+        Args:
+            space_key: Space key
+            export_dir: Directory of the export in progress
+        """
+        base_dir = os.path.dirname(export_dir)
+        pattern = re.compile(re.escape(sanitize_filename(space_key)) + r'_\d{8}_\d{6}$')
+        try:
+            candidates = sorted(
+                (name for name in os.listdir(base_dir)
+                 if pattern.match(name) and name != os.path.basename(export_dir)),
+                reverse=True
+            )
+        except OSError:
+            return
+        
+        for name in candidates:
+            manifest_file = os.path.join(base_dir, name, _MANIFEST_FILENAME)
+            try:
+                with open(manifest_file, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                continue
+            self._prev_export_dir = os.path.join(base_dir, name)
+            self._prev_attachments = manifest.get('attachments', {})
+            logger.info(f"Incremental export: reusing unchanged attachments from {self._prev_export_dir}")
+            return
+        
+        logger.info("Incremental export: no previous export found, exporting everything")
+    
+    def _write_manifest(self, export_dir: str) -> None:
+        """Record exported page and attachment versions for incremental exports.
+        
+        Args:
+            export_dir: Export directory
+        """
+        manifest_file = os.path.join(export_dir, _MANIFEST_FILENAME)
+        try:
+            _dump_json(self._manifest, manifest_file)
+        except OSError as e:
+            logger.warning(f"Failed to write export manifest: {e}")
     
-    def _export_page_comments(self, page_id: str, content_dir: str, page_title: str) -> None:
+    def _export_page_comments(self, page_id: str, content_dir: str, page_title: str,
+                              comments: Optional[List[Dict[str, Any]]] = None,
+                              stats: Optional[Dict[str, Any]] = None,
+                              safe_title: Optional[str] = None) -> None:
         """Export comments for a page.
         
         Args:
             page_id: Page ID
             content_dir: Content directory
             page_title: Page title for directory naming
+            comments: Comments already fetched with the page, if any
+            stats: Counters to update (defaults to export_stats)
+            safe_title: sanitize_filename(page_title), if already computed
         """
+        if stats is None:
+            stats = self.export_stats
         try:
-            comments = self.client.get_page_comments(page_id)
+            if comments is None:
+                comments = self.client.get_page_comments(page_id)
             
             if not comments:
                 return
             
             # Create comments directory for this page
-            safe_title = sanitize_filename(page_title)
+            if safe_title is None:
+                safe_title = sanitize_filename(page_title)
             comments_dir = os.path.join(content_dir, 'comments', safe_title)
-            os.makedirs(comments_dir, exist_ok=True)
+            _make_leaf_dir(comments_dir)
             
-            # Save comments as JSON
-            comments_file = os.path.join(comments_dir, 'comments.json')
-            with open(comments_file, 'w', encoding='utf-8') as f:
-                json.dump(comments, f, indent=2, ensure_ascii=False)
+            # Save comments as JSON and HTML
+            self._write_comments(comments, comments_dir, page_title)
             
-            # Create HTML version of comments
-            self._create_comments_html(comments, comments_dir, page_title)
-            
-            self.export_stats['comments_exported'] += len(comments)
+            stats['comments_exported'] += len(comments)
             logger.debug(f"Exported {len(comments)} comments for page: {page_title}")
             
         except Exception as e:
             error_msg = f"Failed to export comments for page {page_title}: {e}"
             logger.warning(error_msg)
-            self.export_stats['errors'].append(error_msg)
+            stats['errors'].append(error_msg)
     
-    def _create_comments_html(self, comments: List[Dict[str, Any]], 
-                            comments_dir: str, page_title: str) -> None:
-        """Create HTML version of comments.
+    def _write_comments(self, comments: List[Dict[str, Any]],
+                        comments_dir: str, page_title: str) -> None:
+        """Write comments.json and its HTML rendering, comments.html.
+        
+        Both files are written in a single pass, one comment at a time.
         
         Args:
             comments: List of comment dictionaries
             comments_dir: Comments directory
             page_title: Page title
         """
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Comments for: {page_title}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; margin: 40px; }}
-        .comment {{ border: 1px solid #ddd; margin: 10px 0; padding: 15px; border-radius: 5px; }}
-        .comment-author {{ font-weight: bold; color: #333; }}
-        .comment-date {{ color: #666; font-size: 0.9em; }}
-        .comment-content {{ margin-top: 10px; }}
-    </style>
-</head>
-<body>
-    <h1>Comments for: {page_title}</h1>
-"""
-        
-        for comment in comments:
-            author = comment.get('version', {}).get('by', {}).get('displayName', 'Unknown')
-            date = comment.get('version', {}).get('when', 'Unknown')
-            content = comment.get('body', {}).get('view', {}).get('value', '')
-            
-            html_content += f"""
-    <div class="comment">
-        <div class="comment-author">{author}</div>
-        <div class="comment-date">{date}</div>
-        <div class="comment-content">{content}</div>
-    </div>
-"""
-        
-        html_content += """
-</body>
-</html>"""
-        
+        comments_file = os.path.join(comments_dir, 'comments.json')
         comments_html_file = os.path.join(comments_dir, 'comments.html')
-        with open(comments_html_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        with open(comments_file, 'wb') as json_out, \
+                open(comments_html_file, 'w', encoding='utf-8') as html_out:
+            json_out.write(b'[')
+            html_out.write(_COMMENTS_HTML_PREFIX.format(page_title=html.escape(page_title)))
+            
+            for i, comment in enumerate(comments):
+                if i:
+                    json_out.write(b',')
+                json_out.write(_encode_json(comment))
+                
+                version = comment.get('version', {})
+                author = self._author_name(version.get('by', {}))
+                date = version.get('when', 'Unknown')
+                content = comment.get('body', {}).get('view', {}).get('value', '')
+                
+                html_out.write(_COMMENT_HTML_TEMPLATE.format(
+                    author=html.escape(str(author)),
+                    date=html.escape(str(date)),
+                    content=content,
+                ))
+            
+            json_out.write(b']')
+            html_out.write(_COMMENTS_HTML_SUFFIX)
     
     def _create_export_summary(self, export_dir: str, space_info: Dict[str, Any]) -> None:
         """Create export summary report.
@@ -598,13 +954,16 @@ class ConfluenceExporter:
         parent_dir = os.path.dirname(export_dir)
         export_dirname = os.path.basename(export_dir)
         
-        # Save as JSON
+        # Save as JSON (pretty-printed: the summary is meant to be read by
+        # people) and as readable HTML; the two files are independent
         summary_file = os.path.join(parent_dir, f'{export_dirname}_summary.json')
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
-        
-        # Create readable HTML summary
-        self._create_html_summary(summary, parent_dir, export_dirname)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(_dump_json, summary, summary_file, pretty=True),
+                executor.submit(self._create_html_summary, summary, parent_dir, export_dirname),
+            ]
+            for future in futures:
+                future.result()
         
         logger.info(f"Export summary saved to {summary_file}")
     
@@ -616,27 +975,21 @@ class ConfluenceExporter:
             parent_dir: Parent directory where summary should be saved
             export_dirname: Name of the export directory
         """
-        html_content = f"""<!DOCTYPE html>
+        space_name = html.escape(str(summary['export_info']['space_name']))
+        space_key = html.escape(str(summary['export_info']['space_key']))
+        parts = [f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Export Summary - {summary['export_info']['space_name']}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; margin: 40px; }}
-        .summary-header {{ color: #333; border-bottom: 2px solid #ddd; padding-bottom: 10px; }}
-        .section {{ margin: 20px 0; }}
-        .stats {{ background-color: #f5f5f5; padding: 15px; border-radius: 5px; }}
-        .error {{ color: #d32f2f; }}
-        .success {{ color: #388e3c; }}
-    </style>
-</head>
+    <title>Export Summary - {space_name}</title>
+{_SUMMARY_HTML_STYLE}</head>
 <body>
     <h1 class="summary-header">Export Summary</h1>
     
     <div class="section">
         <h2>Space Information</h2>
-        <p><strong>Space:</strong> {summary['export_info']['space_name']} ({summary['export_info']['space_key']})</p>
+        <p><strong>Space:</strong> {space_name} ({space_key})</p>
         <p><strong>Export Date:</strong> {summary['export_info']['export_date']}</p>
         <p><strong>Duration:</strong> {summary['export_info']['export_duration']}</p>
     </div>
@@ -654,25 +1007,26 @@ class ConfluenceExporter:
             </li>
         </ul>
     </div>
-"""
+"""]
         
         if summary['errors']:
-            html_content += """
+            parts.append("""
     <div class="section">
         <h2>Errors</h2>
         <ul>
-"""
-            for error in summary['errors']:
-                html_content += f"            <li class='error'>{error}</li>\n"
-            
-            html_content += """        </ul>
+""")
+            parts.extend(
+                f"            <li class='error'>{html.escape(str(error))}</li>\n"
+                for error in summary['errors']
+            )
+            parts.append("""        </ul>
     </div>
-"""
+""")
         
-        html_content += """
+        parts.append("""
 </body>
-</html>"""
+</html>""")
         
         html_summary_file = os.path.join(parent_dir, f'{export_dirname}_summary.html')
         with open(html_summary_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
\ No newline at end of file
+            f.write(''.join(parts))
\ No newline at end of file
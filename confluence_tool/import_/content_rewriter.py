@@ -1,13 +1,86 @@
 """Content rewriter for space key remapping during import."""
 
+import functools
 import re
 import logging
-from typing import Dict, Any, Tuple
-from xml.etree import ElementTree as ET
+from typing import Dict, Any, NamedTuple, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+class _RewritePatterns(NamedTuple):
+    """Compiled patterns and replacement templates for one key remapping."""
+    old_key_any_case_re: re.Pattern
+    xml_tag: str
+    xml_tag_repl: str
+    wiki_re: re.Pattern
+    wiki_repl: str
+    anchor_re: re.Pattern
+    anchor_path_re: re.Pattern
+    anchor_path_repl: str
+    macro_re: re.Pattern
+    macro_repl: str
+    attach_re: re.Pattern
+    attach_repl: str
+
+
+@functools.lru_cache(maxsize=128)
+def _build_patterns(old_space_key: str, new_space_key: str) -> _RewritePatterns:
+    """Compile the rewrite patterns for remapping old_space_key to new_space_key.
+    
+    Replacements use \\g<n> so a new key starting with a digit can't be read
+    as part of the group number.
+    """
+    old = re.escape(old_space_key)
+    new = new_space_key.replace('\\', r'\\')
+    return _RewritePatterns(
+        # The anchor pattern is case-insensitive, so content can need
+        # rewriting without containing the key in its exact case
+        old_key_any_case_re=re.compile(old, re.IGNORECASE),
+        # <ri:space-key>SPACEKEY</ri:space-key> is a fixed literal, so it is
+        # replaced with str.replace rather than a regex
+        xml_tag=f'<ri:space-key>{old_space_key}</ri:space-key>',
+        xml_tag_repl=f'<ri:space-key>{new_space_key}</ri:space-key>',
+        # [text|SPACE:page] or [SPACE:page]
+        wiki_re=re.compile(rf'\[([^\]]*?\|)?{old}:([^\]]+)\]'),
+        wiki_repl=rf'[\g<1>{new}:\g<2>]',
+        # href values holding /wiki/spaces/SPACE/ anywhere: relative
+        # (href="/wiki/spaces/SPACE/...) and absolute
+        # (href="https://domain/wiki/spaces/SPACE/...) URLs alike.  Every
+        # occurrence inside the value is rewritten, e.g. in a
+        # ?return=/wiki/spaces/SPACE/... parameter too.
+        anchor_re=re.compile(rf'(href=["\'])([^"\']*/wiki/spaces/{old}/)', re.IGNORECASE),
+        anchor_path_re=re.compile(rf'(/wiki/spaces/){old}(/)', re.IGNORECASE),
+        anchor_path_repl=rf'\g<1>{new}\g<2>',
+        # <ac:parameter ac:name="...">SPACE:...</ac:parameter>
+        macro_re=re.compile(rf'(<ac:parameter[^>]*>){old}:([^<]*</ac:parameter>)'),
+        macro_repl=rf'\g<1>{new}:\g<2>',
+        # src="...download/attachments/<id>/spaces/SPACE/
+        attach_re=re.compile(rf'(src=["\'][^"\']*?/download/attachments/[^/]+/spaces/){old}(/)'),
+        attach_repl=rf'\g<1>{new}\g<2>',
+    )
+
+
+def _subn(pattern: re.Pattern, repl: str, content: str) -> Tuple[str, int]:
+    """pattern.subn(repl, content), returning content itself if nothing matched.
+    
+    Keeps unchanged content as the same object, so callers never hold a
+    needless copy.
+    """
+    new_content, count = pattern.subn(repl, content)
+    return (new_content if count else content), count
+
+
+# Statistics reported per rewrite_content call and accumulated in .stats
+_STAT_KEYS = (
+    'links_rewritten',
+    'macros_updated',
+    'attachments_updated',
+    'wiki_links_updated',
+    'html_anchors_updated',
+)
+
+
 class ContentRewriter:
     """Handles rewriting of space key references in Confluence content."""
     
@@ -20,13 +93,14 @@ class ContentRewriter:
         """
         self.old_space_key = old_space_key
         self.new_space_key = new_space_key
-        self.stats = {
-            'links_rewritten': 0,
-            'macros_updated': 0,
-            'attachments_updated': 0,
-            'wiki_links_updated': 0,
-            'html_anchors_updated': 0
-        }
+        # Remapping a key onto itself (e.g. re-importing into the same space)
+        # leaves every piece of content unchanged
+        self._noop = old_space_key == new_space_key
+        
+        # Compiled once per key pair and shared by every rewriter using it
+        self._patterns = _build_patterns(old_space_key, new_space_key)
+        
+        self.stats = dict.fromkeys(_STAT_KEYS, 0)
     
     def rewrite_content(self, content: str) -> Tuple[str, Dict[str, int]]:
         """Rewrite all space key references in content.
@@ -37,51 +111,49 @@ class ContentRewriter:
         Returns:
             Tuple of (rewritten_content, statistics)
         """
-        # Initialize per-content stats
-        content_stats = {
-            'links_rewritten': 0,
-            'macros_updated': 0,
-            'attachments_updated': 0,
-            'wiki_links_updated': 0,
-            'html_anchors_updated': 0
-        }
+        if self._noop or not content:
+            return content, dict.fromkeys(_STAT_KEYS, 0)
         
-        if not content:
-            return content, content_stats
-        
-        original_content = content
+        # Most content doesn't mention the old key at all; a plain substring
+        # test is far cheaper than running the rewrite patterns over it
+        if not self._mentions_old_key(content):
+            return content, dict.fromkeys(_STAT_KEYS, 0)
         
         # 1. Rewrite Confluence XML space key tags: <ri:space-key>KB</ri:space-key>
-        content, count = self._rewrite_xml_space_keys(content)
-        content_stats['links_rewritten'] += count
+        content, links = self._rewrite_xml_space_keys(content)
         
         # 2. Rewrite wiki-style links: [Page Title|KB:Page Title]
-        content, count = self._rewrite_wiki_links(content)
-        content_stats['wiki_links_updated'] += count
+        content, wiki_links = self._rewrite_wiki_links(content)
         
         # 3. Rewrite HTML anchor tags with space URLs: /wiki/spaces/KB/pages/...
-        content, count = self._rewrite_html_anchors(content)
-        content_stats['html_anchors_updated'] += count
+        content, anchors = self._rewrite_html_anchors(content)
         
         # 4. Rewrite macro parameters with space keys
-        content, count = self._rewrite_macro_space_parameters(content)
-        content_stats['macros_updated'] += count
+        content, macros = self._rewrite_macro_space_parameters(content)
         
         # 5. Rewrite attachment space key references
-        content, count = self._rewrite_attachment_space_keys(content)
-        content_stats['attachments_updated'] += count
+        content, attachments = self._rewrite_attachment_space_keys(content)
+        
+        # Same order as _STAT_KEYS
+        counts = (links, macros, attachments, wiki_links, anchors)
+        total_changes = sum(counts)
+        if not total_changes:
+            return content, dict.fromkeys(_STAT_KEYS, 0)
         
         # Update cumulative stats
-        for key in content_stats:
-            self.stats[key] += content_stats[key]
+        content_stats = dict(zip(_STAT_KEYS, counts))
+        for key, count in content_stats.items():
+            self.stats[key] += count
         
-        # Log rewriting if changes were made
-        if content != original_content:
-            total_changes = sum(content_stats.values())
-            logger.debug(f"Rewrote {total_changes} space key references in content")
+        logger.debug("Rewrote %d space key references in content", total_changes)
         
         return content, content_stats
     
+    def _mentions_old_key(self, content: str) -> bool:
+        """Whether content contains the old space key in any letter case."""
+        return (self.old_space_key in content
+                or self._patterns.old_key_any_case_re.search(content) is not None)
+    
     def _rewrite_xml_space_keys(self, content: str) -> Tuple[str, int]:
         """Rewrite <ri:space-key>OLD</ri:space-key> tags.
         
@@ -91,18 +163,11 @@ class ContentRewriter:
         Returns:
             Tuple of (rewritten_content, count)
         """
-        count = 0
-        
-        # Pattern to match <ri:space-key>SPACEKEY</ri:space-key>
-        # Use word boundaries to avoid partial matches
-        pattern = rf'(<ri:space-key>){re.escape(self.old_space_key)}(</ri:space-key>)'
-        
-        matches = list(re.finditer(pattern, content))
-        count = len(matches)
-        
+        tag = self._patterns.xml_tag
+        count = content.count(tag)
         if count > 0:
-            content = re.sub(pattern, rf'\1{self.new_space_key}\2', content)
-            logger.debug(f"Rewrote {count} <ri:space-key> tags")
+            content = content.replace(tag, self._patterns.xml_tag_repl)
+            logger.debug("Rewrote %d <ri:space-key> tags", count)
         
         return content, count
     
@@ -115,23 +180,27 @@ class ContentRewriter:
         Returns:
             Tuple of (rewritten_content, count)
         """
-        count = 0
-        
-        # Pattern to match [text|SPACE:page] or [SPACE:page]
-        # Use word boundary before space key to avoid partial matches
-        pattern = rf'\[([^\]]*?\|)?{re.escape(self.old_space_key)}:([^\]]+)\]'
-        
-        matches = list(re.finditer(pattern, content))
-        count = len(matches)
+        if self.old_space_key not in content:
+            return content, 0
+        
+        # A link ends at the first ']' after its '['.  Without a ']' further
+        # on, each '[' would make the pattern rescan the rest of the content
+        # once per "|OLD:" it passes, which is cubic on unbalanced input, so
+        # only search up to the last ']'.
+        end = content.rfind(']') + 1
+        if not end:
+            return content, 0
+        
+        # Replace OLD:page with NEW:page
+        if end == len(content):
+            content, count = _subn(self._patterns.wiki_re, self._patterns.wiki_repl, content)
+        else:
+            head, count = self._patterns.wiki_re.subn(self._patterns.wiki_repl, content[:end])
+            if count > 0:
+                content = head + content[end:]
         
         if count > 0:
-            # Replace OLD:page with NEW:page
-            content = re.sub(
-                pattern,
-                rf'[\1{self.new_space_key}:\2]',
-                content
-            )
-            logger.debug(f"Rewrote {count} wiki-style links")
+            logger.debug("Rewrote %d wiki-style links", count)
         
         return content, count
     
@@ -144,30 +213,28 @@ class ContentRewriter:
         Returns:
             Tuple of (rewritten_content, count)
         """
+        if not self._mentions_old_key(content):
+            return content, 0
+        
+        # Match href="/wiki/spaces/SPACE/..." and
+        # href="https://domain/wiki/spaces/SPACE/...", then rewrite every
+        # space path inside each matched value
+        path_re = self._patterns.anchor_path_re
+        path_repl = self._patterns.anchor_path_repl
         count = 0
         
-        # Pattern to match href="/wiki/spaces/SPACE/..."
-        # Also match href="https://domain/wiki/spaces/SPACE/..."
-        patterns = [
-            # Relative URLs: /wiki/spaces/SPACE/
-            (rf'(href=["\'])(/wiki/spaces/){re.escape(self.old_space_key)}(/)', rf'\1\2{self.new_space_key}\3'),
-            # Absolute URLs: https://domain/wiki/spaces/SPACE/
-            (rf'(href=["\'][^"\']*?/wiki/spaces/){re.escape(self.old_space_key)}(/)', rf'\1{self.new_space_key}\2'),
-        ]
-        
-        for pattern, replacement in patterns:
-            matches = list(re.finditer(pattern, content, re.IGNORECASE))
-            if matches:
-                count += len(matches)
-                content = re.sub(
-                    pattern,
-                    replacement,
-                    content,
-                    flags=re.IGNORECASE
-                )
+        def rewrite_href(match):
+            nonlocal count
+            value, n = path_re.subn(path_repl, match.group(2))
+            count += n
+            return match.group(1) + value
+        
+        rewritten = self._patterns.anchor_re.sub(rewrite_href, content)
+        if count > 0:
+            content = rewritten
         
         if count > 0:
-            logger.debug(f"Rewrote {count} HTML anchor space URLs")
+            logger.debug("Rewrote %d HTML anchor space URLs", count)
         
         return content, count
     
@@ -180,25 +247,19 @@ class ContentRewriter:
         Returns:
             Tuple of (rewritten_content, count)
         """
-        count = 0
-        
         # Pattern to match macro parameters with space keys
         # Example: <ac:parameter ac:name="root"><ri:space-key>SPACE</ri:space-key></ac:parameter>
         # This is already handled by _rewrite_xml_space_keys, but we'll also handle
-        # plain text space parameters
+        # plain text space parameters, which can only occur inside an
+        # <ac:parameter> element
+        
+        if self.old_space_key not in content or '<ac:parameter' not in content:
+            return content, 0
         
         # Match: <ac:parameter ac:name="...">SPACE:...</ac:parameter>
-        pattern = rf'(<ac:parameter[^>]*>){re.escape(self.old_space_key)}:([^<]*</ac:parameter>)'
-        
-        matches = list(re.finditer(pattern, content))
-        if matches:
-            count = len(matches)
-            content = re.sub(
-                pattern,
-                rf'\1{self.new_space_key}:\2',
-                content
-            )
-            logger.debug(f"Rewrote {count} macro space parameters")
+        content, count = _subn(self._patterns.macro_re, self._patterns.macro_repl, content)
+        if count > 0:
+            logger.debug("Rewrote %d macro space parameters", count)
         
         return content, count
     
@@ -211,24 +272,17 @@ class ContentRewriter:
         Returns:
             Tuple of (rewritten_content, count)
         """
-        count = 0
-        
         # Pattern to match attachment references with space keys
         # <ri:attachment ...><ri:space-key>SPACE</ri:space-key>...
         # This is handled by _rewrite_xml_space_keys, so just count those
         
+        if self.old_space_key not in content or '/download/attachments/' not in content:
+            return content, 0
+        
         # Additional pattern for attachment URLs in src attributes
-        pattern = rf'(src=["\'][^"\']*?/download/attachments/[^/]+/spaces/){re.escape(self.old_space_key)}(/)'
-        
-        matches = list(re.finditer(pattern, content))
-        if matches:
-            count = len(matches)
-            content = re.sub(
-                pattern,
-                rf'\1{self.new_space_key}\2',
-                content
-            )
-            logger.debug(f"Rewrote {count} attachment space URLs")
+        content, count = _subn(self._patterns.attach_re, self._patterns.attach_repl, content)
+        if count > 0:
+            logger.debug("Rewrote %d attachment space URLs", count)
         
         return content, count
     
@@ -242,5 +296,5 @@ class ContentRewriter:
     
     def reset_stats(self) -> None:
         """Reset statistics counters."""
-        for key in self.stats:
+        for key in _STAT_KEYS:
             self.stats[key] = 0
@@ -6,9 +6,13 @@ import logging
 import html
 import time
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Callable
 from datetime import datetime
 import concurrent.futures
+import threading
+import functools
+import itertools
+from collections import deque
 from tqdm import tqdm
 import re
 from html.parser import HTMLParser
@@ -20,6 +24,240 @@ from .content_rewriter import ContentRewriter
 
 logger = logging.getLogger(__name__)
 
+# orjson is an optional, much faster decoder for the export's JSON files
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Patterns for reading pages back out of exported HTML, compiled once with
+# their flags
+_PAGE_TITLE_H1_RE = re.compile(r'<h1[^>]*class="page-title"[^>]*>(.*?)</h1>', re.DOTALL)
+_PAGE_TITLE_TAG_RE = re.compile(r'<title>(.*?)</title>')
+_BODY_RE = re.compile(r'<body[^>]*>(.*?)</body>', re.DOTALL)
+# The exporter's trailing metadata block
+_METADATA_DIV_RE = re.compile(r'<div[^>]*class="[^"]*metadata[^"]*"[^>]*>.*?</div>', re.DOTALL)
+
+# Opening and closing div tags, for the regex fallback's depth tracking
+_DIV_TAG_RE = re.compile(r'<div\b|</div>')
+
+
+@functools.lru_cache(maxsize=None)
+def _div_start_re(class_name: str) -> 're.Pattern':
+    """Compile the opening-tag pattern for a div with the given class."""
+    return re.compile(rf'<div[^>]*class="[^"]*{re.escape(class_name)}[^"]*"[^>]*>', re.DOTALL)
+
+
+def _load_json(path: str) -> Any:
+    """Load a JSON file from the export.
+    
+    Reads the raw bytes in a single call and decodes them with orjson when
+    it is installed, or json.loads otherwise.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        Decoded JSON data
+    """
+    with open(path, 'rb', buffering=64 * 1024) as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. a BOM or NaN, which the stdlib decoder accepts
+            pass
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    # The stat fields are only part of the cache key
+    return _load_json(path)
+
+
+def _load_shared_json(path: str) -> Any:
+    """Load an export-wide JSON file, reusing it while it is unchanged.
+    
+    Repeated imports from the same export directory (retries, partial
+    imports) share one decoded copy for as long as the file's mtime and
+    size stay the same.  The result is shared, so callers must not
+    modify it.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        Decoded JSON data
+    """
+    st = os.stat(path)
+    return _load_json_cached(path, st.st_mtime_ns, st.st_size)
+
+
+def _text_offset(text: str, pos: Tuple[int, int]) -> int:
+    """Convert an HTMLParser (line, column) position into a string offset."""
+    lineno, col = pos
+    offset = 0
+    for _ in range(lineno - 1):
+        offset = text.index('\n', offset) + 1
+    return offset + col
+
+
+class _DivContentLocator(HTMLParser):
+    """Find where the content of a div with a given class starts and ends.
+    
+    Only positions are recorded; the parser stops as soon as the div closes.
+    """
+    
+    class Found(Exception):
+        """Raised to stop parsing once the target div has closed."""
+    
+    def __init__(self, target_class: str):
+        super().__init__(convert_charrefs=False)
+        self.target_class = target_class
+        self.depth = 0
+        self.start: Optional[Tuple[int, int]] = None  # Position of the opening tag
+        self.start_tag = ''
+        self.end: Optional[Tuple[int, int]] = None    # Position of the closing tag
+    
+    def handle_starttag(self, tag, attrs):
+        if tag != 'div':
+            return
+        if self.start is None:
+            classes = (dict(attrs).get('class') or '').split()
+            if self.target_class in classes:
+                self.start = self.getpos()
+                self.start_tag = self.get_starttag_text()
+                self.depth = 1
+        else:
+            self.depth += 1
+    
+    def handle_startendtag(self, tag, attrs):
+        # A self-closed tag never changes the div nesting depth
+        pass
+    
+    def handle_endtag(self, tag):
+        if tag == 'div' and self.start is not None:
+            self.depth -= 1
+            if self.depth == 0:
+                self.end = self.getpos()
+                raise self.Found()
+
+
+def _extract_div_content(html_content: str, class_name: str) -> str:
+    """Extract content from a div with the given class name, handling nested divs.
+    
+    This function uses HTMLParser to properly track div nesting depth and find
+    the complete content of a div, even when it contains nested div elements or
+    text that contains '<div>' or '</div>' strings.  The content is sliced
+    straight out of html_content, so markup, entities and CDATA sections come
+    back exactly as exported.
+    
+    Args:
+        html_content: Full HTML content
+        class_name: CSS class name to search for
+    
+    Returns:
+        Content inside the div, or empty string if not found
+    """
+    locator = _DivContentLocator(class_name)
+    try:
+        locator.feed(html_content)
+    except _DivContentLocator.Found:
+        pass
+    except Exception as e:
+        logger.warning(f"HTMLParser failed for class '{class_name}': {e}. Falling back to regex.")
+        # Fallback to the original regex-based approach if HTMLParser fails
+        return _extract_div_content_regex(html_content, class_name)
+    
+    if locator.start is None:
+        return ""
+    
+    start = _text_offset(html_content, locator.start) + len(locator.start_tag)
+    end = _text_offset(html_content, locator.end) if locator.end else len(html_content)
+    return html_content[start:end].strip()
+
+
+def _extract_div_content_regex(html_content: str, class_name: str) -> str:
+    """Fallback regex-based extraction (original implementation).
+    
+    Args:
+        html_content: Full HTML content
+        class_name: CSS class name to search for
+    
+    Returns:
+        Content inside the div, or empty string if not found
+    """
+    # Find the start of the target div
+    start_match = _div_start_re(class_name).search(html_content)
+    
+    if not start_match:
+        return ""
+    
+    # Start searching after the opening tag
+    pos = start_match.end()
+    depth = 1
+    
+    # Track nested divs by counting opening and closing tags in one scan
+    for tag_match in _DIV_TAG_RE.finditer(html_content, pos):
+        if tag_match.group() == '</div>':
+            depth -= 1
+            if depth == 0:
+                # Found the matching closing tag
+                return html_content[pos:tag_match.start()].strip()
+        else:
+            depth += 1
+    
+    # If we couldn't find matching closing tag, return what we found
+    return html_content[pos:].strip()
+
+
+def _read_page_content(html_path: str) -> Tuple[str, str]:
+    """Extract title and content from an exported HTML file.
+    
+    Pure with respect to importer state, so it can run in a worker process.
+    
+    Args:
+        html_path: Path to HTML file
+        
+    Returns:
+        Tuple of (title, content)
+    """
+    with open(html_path, 'r', encoding='utf-8') as f:
+        html_content = f.read()
+    
+    # Extract title from HTML
+    title_match = _PAGE_TITLE_H1_RE.search(html_content)
+    if not title_match:
+        title_match = _PAGE_TITLE_TAG_RE.search(html_content)
+    
+    # The exporter HTML-escapes titles ("R&amp;D"); older exports
+    # wrote them raw, which unescape leaves alone
+    title = html.unescape(title_match.group(1).strip()) if title_match else ""
+    
+    # Extract content from page-content div
+    # Use proper div matching to handle nested divs correctly
+    content = _extract_div_content(html_content, 'page-content')
+    
+    if not content:
+        # Fallback: extract body content
+        body_match = _BODY_RE.search(html_content)
+        content = body_match.group(1).strip() if body_match else html_content
+    
+    # Clean up content - remove metadata div if present
+    # Simple approach: if metadata div exists, just use regex to remove it
+    # since we know it's a simple div at the end
+    return title, _METADATA_DIV_RE.sub('', content)
+
+
+def _read_page_content_in_worker(html_path: str) -> Optional[Tuple[str, str]]:
+    """Pool task: extract one page, leaving failures to be retried and logged in the importer."""
+    try:
+        return _read_page_content(html_path)
+    except Exception:
+        return None
+
 
 class ConfluenceImporter:
     """Robust Confluence space importer with comprehensive error handling."""
@@ -39,6 +277,8 @@ class ConfluenceImporter:
             'pages_skipped': 0,
             'folders_imported': 0,
             'databases_imported': 0,
+            'folders_reused': 0,
+            'databases_reused': 0,
             'attachments_imported': 0,
             'errors': [],
             'start_time': None,
@@ -52,10 +292,24 @@ class ConfluenceImporter:
         # been created yet to proceed — they'll be moved into the folder later.
         self._known_folder_ids: set = set()
         self.target_space_id = None  # Numeric space ID for the target space (v2 API)
+        # Folders and databases already in the target space, keyed by
+        # (new parent ID, title); filled once by _index_existing_containers
+        self._existing_folders: Optional[Dict[Tuple[Optional[str], str], str]] = None
+        self._existing_databases: Dict[Tuple[Optional[str], str], str] = {}
+        # Target space content by (space key, content type), then title;
+        # listed once per run by _find_existing_page
+        self._existing_pages: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = {}
+        self._existing_pages_lock = threading.Lock()
+        # Spaces looked up by _verify_target_space, by key (None if not found)
+        self._spaces_by_key: Dict[str, Optional[Dict[str, Any]]] = {}
         # {old_page_id: {"parentId": old_parent_id, "parentType": "folder"|"page"|…}}
-        # Loaded from v2_page_parents.json when present in the export.
+        # Loaded from v2_page_parents.json when present in the export; parentId
+        # is normalized to a str (or None) on load.
         self.v2_page_parents: Dict[str, Any] = {}
         self.content_rewriter = None  # Will be set if space key remapping is enabled
+        # Pages are imported on worker threads; guards the counters in
+        # import_stats and remapping_stats
+        self._stats_lock = threading.Lock()
         self.remapping_stats = {
             'links_rewritten': 0,
             'macros_updated': 0,
@@ -101,32 +355,39 @@ class ConfluenceImporter:
             # Verify target space exists
             self._verify_target_space(target_space_key)
 
+            # List the export directory once instead of probing each
+            # optional part of it separately
+            with os.scandir(export_dir) as entries:
+                export_entries = {entry.name for entry in entries}
+
             # Cache the v2-format space ID for v2 API operations (folders, databases).
             # The v1 integer ID causes 500 errors on Atlassian Cloud v2 endpoints.
             self.target_space_id = (
                 self.client.get_space_id_v2(target_space_key)
-                or self.client.get_space_id(target_space_key)
+                or self._get_space_id(target_space_key)
             )
 
             # Import folders first (if available)
-            folders_dir = os.path.join(export_dir, 'folders')
-            if os.path.exists(folders_dir):
-                self._import_folders(folders_dir, target_space_key)
+            if 'folders' in export_entries:
+                self._import_folders(os.path.join(export_dir, 'folders'), target_space_key)
 
             # Import database stubs (if available — Cloud only)
             # Must happen before pages so database IDs are mapped before child pages import
-            databases_dir = os.path.join(export_dir, 'databases')
-            if os.path.exists(databases_dir):
-                self._import_databases(databases_dir, target_space_key)
+            if 'databases' in export_entries:
+                self._import_databases(os.path.join(export_dir, 'databases'), target_space_key)
             
             # Load v2 page-parent data if present (produced by the folder exporter).
             # Used to reliably detect folder parents during page import, since
             # the v1 ancestors array may not include folder ancestors.
-            v2_parents_file = os.path.join(export_dir, 'v2_page_parents.json')
-            if os.path.exists(v2_parents_file):
+            if 'v2_page_parents.json' in export_entries:
+                v2_parents_file = os.path.join(export_dir, 'v2_page_parents.json')
                 try:
-                    with open(v2_parents_file, 'r', encoding='utf-8') as f:
-                        self.v2_page_parents = json.load(f)
+                    # Build a new dict rather than editing the shared cached one
+                    self.v2_page_parents = {
+                        page_id: dict(v2_info, parentId=(str(v2_info['parentId'])
+                                                         if v2_info.get('parentId') else None))
+                        for page_id, v2_info in _load_shared_json(v2_parents_file).items()
+                    }
                     logger.info(
                         f"Loaded v2 parent info for {len(self.v2_page_parents)} pages"
                     )
@@ -134,14 +395,13 @@ class ConfluenceImporter:
                     logger.warning(f"Could not load v2_page_parents.json: {e}")
 
             # Import pages
-            pages_dir = os.path.join(export_dir, 'pages')
-            if os.path.exists(pages_dir):
-                self._import_pages(pages_dir, target_space_key)
+            if 'pages' in export_entries:
+                self._import_pages(os.path.join(export_dir, 'pages'), target_space_key)
             
             # Import blog posts
-            blogposts_dir = os.path.join(export_dir, 'blogposts')
-            if os.path.exists(blogposts_dir):
-                self._import_pages(blogposts_dir, target_space_key, content_type='blogpost')
+            if 'blogposts' in export_entries:
+                self._import_pages(os.path.join(export_dir, 'blogposts'), target_space_key,
+                                   content_type='blogpost')
 
             # Import page-parented folders (deferred from folder phase —
             # page_mapping is now fully populated)
@@ -164,6 +424,8 @@ class ConfluenceImporter:
                        f"Skipped: {self.import_stats['pages_skipped']} pages, "
                        f"Folders: {self.import_stats['folders_imported']}, "
                        f"Database stubs: {self.import_stats['databases_imported']}, "
+                       f"Reused folders: {self.import_stats['folders_reused']}, "
+                       f"Reused database stubs: {self.import_stats['databases_reused']}, "
                        f"Attachments: {self.import_stats['attachments_imported']}")
             
             if self.import_stats['errors']:
@@ -239,8 +501,7 @@ class ConfluenceImporter:
         
         if os.path.exists(metadata_file):
             try:
-                with open(metadata_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return _load_json(metadata_file)
             except Exception as e:
                 logger.warning(f"Could not load export metadata from {metadata_file}: {e}")
         
@@ -248,8 +509,7 @@ class ConfluenceImporter:
         old_metadata_file = os.path.join(export_dir, 'export_summary.json')
         if os.path.exists(old_metadata_file):
             try:
-                with open(old_metadata_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return _load_json(old_metadata_file)
             except Exception as e:
                 logger.warning(f"Could not load export metadata from {old_metadata_file}: {e}")
         
@@ -266,13 +526,9 @@ class ConfluenceImporter:
             ValueError: If space is not accessible
         """
         try:
-            spaces = self.client.get_all_spaces()
-            target_space = None
-            
-            for space in spaces:
-                if space['key'] == space_key:
-                    target_space = space
-                    break
+            if space_key not in self._spaces_by_key:
+                self._spaces_by_key[space_key] = self.client.get_space_by_key(space_key)
+            target_space = self._spaces_by_key[space_key]
             
             if not target_space:
                 raise ValueError(f"Target space '{space_key}' not found or not accessible")
@@ -283,6 +539,20 @@ class ConfluenceImporter:
             logger.error(f"Could not verify target space: {e}")
             raise
     
+    def _get_space_id(self, space_key: str) -> Optional[str]:
+        """Get the v1 space ID, from the verified space when possible.
+        
+        Args:
+            space_key: Space key
+            
+        Returns:
+            Space ID or None if not found
+        """
+        space = self._spaces_by_key.get(space_key)
+        if space and space.get('id'):
+            return space['id']
+        return self.client.get_space_id(space_key)
+    
     def _import_folders(self, folders_dir: str, space_key: str) -> None:
         """Import folders from export directory.
         
@@ -297,8 +567,7 @@ class ConfluenceImporter:
                 logger.info("No folders metadata found, skipping folder import")
                 return
             
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                folders = json.load(f)
+            folders = _load_shared_json(metadata_file)
             
             if not folders:
                 logger.info("No folders to import")
@@ -313,12 +582,14 @@ class ConfluenceImporter:
             # Use the cached v2 space ID if available; otherwise fetch it.
             space_id = self.target_space_id or (
                 self.client.get_space_id_v2(space_key)
-                or self.client.get_space_id(space_key)
+                or self._get_space_id(space_key)
             )
             if not space_id:
                 logger.warning(f"Could not get space ID for {space_key}, skipping folder import")
                 return
             
+            self._index_existing_containers(space_id, space_key)
+            
             # Confluence folders have three parent types:
             #   "space"  → sits at the space root (no page/folder parent)
             #   "folder" → nested inside another folder
@@ -330,44 +601,23 @@ class ConfluenceImporter:
             folder_folders = [f for f in folders if f.get('parentType') == 'folder']
             page_folders   = [f for f in folders if f.get('parentType') == 'page']
 
-            # Import space-root folders immediately (no parent ID needed)
-            for folder in space_folders:
-                try:
-                    self._import_single_folder(folder, space_id, None)
-                except Exception as e:
-                    error_msg = f"Failed to import folder '{folder.get('title', 'Unknown')}': {e}"
-                    logger.warning(error_msg)
-                    self.import_stats['errors'].append(error_msg)
-
-            # Import folder-in-folder hierarchy via multi-pass
-            # (some children may depend on siblings not yet created)
-            max_passes = 10
-            remaining_folder_children = folder_folders.copy()
-
-            for pass_num in range(max_passes):
-                if not remaining_folder_children:
-                    break
-
-                imported_in_pass = []
-
-                for folder in remaining_folder_children:
-                    old_parent_id = folder.get('parentId')
-                    if old_parent_id in self.folder_mapping:
-                        new_parent_id = self.folder_mapping[old_parent_id]
-                        try:
-                            self._import_single_folder(folder, space_id, new_parent_id)
-                            imported_in_pass.append(folder)
-                        except Exception as e:
-                            error_msg = f"Failed to import folder '{folder.get('title', 'Unknown')}': {e}"
-                            logger.warning(error_msg)
-                            self.import_stats['errors'].append(error_msg)
-                            imported_in_pass.append(folder)
-
-                for folder in imported_in_pass:
-                    remaining_folder_children.remove(folder)
-
-                if not imported_in_pass:
-                    break  # No progress — remaining depend on page-parented ancestors
+            def resolve_parent(folder):
+                # Space-root folders need no parent; nested ones need theirs
+                # to have been created already
+                if folder.get('parentType') != 'folder':
+                    return True, None
+                old_parent_id = folder.get('parentId')
+                if old_parent_id in self.folder_mapping:
+                    return True, self.folder_mapping[old_parent_id]
+                return False, None
+
+            # Create space-root folders, then the folder-in-folder hierarchy
+            # beneath them. Chains under a page-parented (or failed) folder
+            # don't resolve here and are retried in phase 2.
+            remaining_folder_children = self._create_by_level(
+                space_folders + folder_folders, 'folder', resolve_parent,
+                lambda folder, parent_id: self._import_single_folder(folder, space_id, parent_id)
+            )
 
             # Defer anything unresolved: page-parented folders, and any folder-in-folder
             # chains whose ancestor is a page-parented folder (resolved in phase 2).
@@ -386,6 +636,109 @@ class ConfluenceImporter:
             # Don't add to errors as folders may not be available in all instances
             logger.debug(f"Folder import error details: {e}", exc_info=True)
     
+    def _create_by_level(self, items: List[Dict[str, Any]], label: str,
+                         resolve_parent: Callable[[Dict[str, Any]], Tuple[bool, Optional[str]]],
+                         create: Callable[[Dict[str, Any], Optional[str]], None]) -> List[Dict[str, Any]]:
+        """Create folders or database stubs parents-first, a level at a time.
+        
+        Items are ordered by their parentId, then grouped by depth.  Items at
+        the same depth never depend on each other, so each level is created
+        concurrently (up to max_workers) once the level above has finished.
+        
+        Args:
+            items: Folder or database metadata dictionaries
+            label: Item description for error messages, e.g. 'folder'
+            resolve_parent: Returns (resolved, new parent ID) for an item
+            create: Creates an item under the given new parent ID
+            
+        Returns:
+            Items whose parent could not be resolved, including any caught
+            in a parent cycle
+        """
+        ordered, unresolved = self._toposort_by_parent(
+            items, lambda i: i.get('id'), lambda i: i.get('parentId')
+        )
+        
+        # The ordering is breadth-first, so each parent's depth is known
+        # before its children are reached
+        depths: Dict[str, int] = {}
+        levels: List[List[Dict[str, Any]]] = []
+        for item in ordered:
+            parent_id = item.get('parentId')
+            depth = 0
+            if parent_id is not None and str(parent_id) in depths:
+                depth = depths[str(parent_id)] + 1
+            if item.get('id') is not None:
+                depths[str(item.get('id'))] = depth
+            if depth == len(levels):
+                levels.append([])
+            levels[depth].append(item)
+        
+        max_workers = self.config.get('max_workers', 3)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for level in levels:
+                futures = {}
+                for item in level:
+                    resolved, new_parent_id = resolve_parent(item)
+                    if resolved:
+                        futures[executor.submit(create, item, new_parent_id)] = item
+                    else:
+                        unresolved.append(item)
+                
+                for future in concurrent.futures.as_completed(futures):
+                    item = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        error_msg = f"Failed to import {label} '{item.get('title', 'Unknown')}': {e}"
+                        logger.warning(error_msg)
+                        self.import_stats['errors'].append(error_msg)
+        
+        return unresolved
+    
+    def _index_existing_containers(self, space_id: str, space_key: str) -> None:
+        """Index the folders and databases that already exist in the target space.
+        
+        Lets a re-run of an import reuse them instead of creating a
+        duplicate for every folder and database stub.  Runs once per
+        importer; failures just leave the index empty.  With the 'rename'
+        conflict resolution nothing is indexed, so new containers are
+        created just as new pages are.
+        
+        Args:
+            space_id: Target space ID
+            space_key: Target space key
+        """
+        if self._existing_folders is not None:
+            return
+        self._existing_folders = {}
+        if self.config.get('conflict_resolution', 'skip') == 'rename':
+            return
+        
+        def index_key(item):
+            parent_id = item.get('parentId')
+            if item.get('parentType') == 'space' or not parent_id:
+                parent_id = None
+            return (str(parent_id) if parent_id else None, item.get('title'))
+        
+        try:
+            # get_databases() reuses the page-parent data get_folders() collects
+            for folder in self.client.get_folders(space_id, space_key):
+                if folder.get('id') and folder.get('title'):
+                    self._existing_folders[index_key(folder)] = folder['id']
+            for database in self.client.get_databases(space_id):
+                if database.get('id') and database.get('title'):
+                    self._existing_databases[index_key(database)] = database['id']
+        except Exception as e:
+            logger.warning("Could not list existing folders/databases in %s: %s", space_key, e)
+        
+        if self._existing_folders or self._existing_databases:
+            logger.info(
+                f"Found {len(self._existing_folders)} existing folder(s) and "
+                f"{len(self._existing_databases)} database(s) in {space_key}; "
+                f"matching ones will be reused"
+            )
+    
     def _import_single_folder(self, folder: Dict[str, Any], space_id: str, 
                             parent_id: Optional[str]) -> None:
         """Import a single folder.
@@ -398,6 +751,17 @@ class ConfluenceImporter:
         old_folder_id = folder.get('id')
         folder_title = folder.get('title', 'Untitled Folder')
         
+        existing_id = (self._existing_folders or {}).get(
+            (str(parent_id) if parent_id else None, folder_title)
+        )
+        if existing_id:
+            if old_folder_id:
+                self.folder_mapping[old_folder_id] = existing_id
+            with self._stats_lock:
+                self.import_stats['folders_reused'] += 1
+            logger.info(f"Reusing existing folder: {folder_title} (old ID: {old_folder_id}, ID: {existing_id})")
+            return
+        
         try:
             # Create the folder
             new_folder = self.client.create_folder(space_id, folder_title, parent_id)
@@ -407,7 +771,8 @@ class ConfluenceImporter:
             if old_folder_id and new_folder_id:
                 self.folder_mapping[old_folder_id] = new_folder_id
             
-            self.import_stats['folders_imported'] += 1
+            with self._stats_lock:
+                self.import_stats['folders_imported'] += 1
             logger.info(f"Created folder: {folder_title} (old ID: {old_folder_id}, new ID: {new_folder_id})")
             
         except Exception as e:
@@ -423,8 +788,8 @@ class ConfluenceImporter:
         populated.
 
         Also handles folder-in-folder chains whose ancestor is a page-parented
-        folder — these were stuck in phase 1 and are resolved here via the same
-        multi-pass approach.
+        folder — these were stuck in phase 1 and are resolved here, parents
+        first.
         """
         deferred = getattr(self, '_deferred_folders', [])
         if not deferred:
@@ -437,59 +802,38 @@ class ConfluenceImporter:
 
         logger.info(f"Importing {len(deferred)} deferred folder(s) (phase 2 — after pages)")
 
-        remaining = deferred.copy()
-        max_passes = 10
-
-        for pass_num in range(max_passes):
-            if not remaining:
-                break
-
-            imported_in_pass = []
+        def resolve_parent(folder):
+            old_parent_id = folder.get('parentId')
+            parent_type   = folder.get('parentType')
+
+            if parent_type == 'page':
+                # Parent is a page — must be in page_mapping by now.
+                # page_mapping keys are stored as strings.
+                str_pid = str(old_parent_id) if old_parent_id is not None else None
+                if str_pid and str_pid in self.page_mapping:
+                    return True, self.page_mapping[str_pid]
+                if old_parent_id in self.folder_mapping:
+                    return True, self.folder_mapping[old_parent_id]
+                return False, None  # Parent page was not imported
+            if parent_type == 'folder':
+                if old_parent_id in self.folder_mapping:
+                    return True, self.folder_mapping[old_parent_id]
+                return False, None  # Parent folder was not created
+            return True, None  # Unexpected type — fall back to space root
+
+        remaining = self._create_by_level(
+            deferred, 'folder', resolve_parent,
+            lambda folder, parent_id: self._import_single_folder(folder, space_id, parent_id)
+        )
 
+        if remaining:
+            logger.warning(
+                f"Could not import {len(remaining)} deferred folder(s) — missing parent references"
+            )
             for folder in remaining:
-                old_parent_id = folder.get('parentId')
-                parent_type   = folder.get('parentType')
-
-                new_parent_id = None
-                if parent_type == 'page':
-                    # Parent is a page — must be in page_mapping by now.
-                    # page_mapping keys are stored as strings.
-                    str_pid = str(old_parent_id) if old_parent_id is not None else None
-                    if str_pid and str_pid in self.page_mapping:
-                        new_parent_id = self.page_mapping[str_pid]
-                    elif old_parent_id in self.folder_mapping:
-                        new_parent_id = self.folder_mapping[old_parent_id]
-                    else:
-                        continue  # Parent page not yet in mapping
-                elif parent_type == 'folder':
-                    if old_parent_id in self.folder_mapping:
-                        new_parent_id = self.folder_mapping[old_parent_id]
-                    else:
-                        continue  # Parent folder not yet created in this phase
-                else:
-                    new_parent_id = None  # Unexpected type — fall back to space root
-
-                try:
-                    self._import_single_folder(folder, space_id, new_parent_id)
-                    imported_in_pass.append(folder)
-                except Exception as e:
-                    error_msg = f"Failed to import folder '{folder.get('title', 'Unknown')}': {e}"
-                    logger.warning(error_msg)
-                    self.import_stats['errors'].append(error_msg)
-                    imported_in_pass.append(folder)  # Don't retry a hard failure
-
-            for folder in imported_in_pass:
-                remaining.remove(folder)
-
-            if not imported_in_pass:
-                logger.warning(
-                    f"Could not import {len(remaining)} deferred folder(s) — missing parent references"
-                )
-                for folder in remaining:
-                    error_msg = f"Skipped folder '{folder.get('title', 'Unknown')}' due to missing parent"
-                    logger.warning(error_msg)
-                    self.import_stats['errors'].append(error_msg)
-                break
+                error_msg = f"Skipped folder '{folder.get('title', 'Unknown')}' due to missing parent"
+                logger.warning(error_msg)
+                self.import_stats['errors'].append(error_msg)
 
         logger.info(
             f"Deferred folder import complete. "
@@ -522,9 +866,7 @@ class ConfluenceImporter:
             if v2_info.get('parentType') != 'folder':
                 continue
 
-            v2_old_parent_id = (
-                str(v2_info['parentId']) if v2_info.get('parentId') is not None else None
-            )
+            v2_old_parent_id = v2_info.get('parentId')
             if not v2_old_parent_id:
                 continue
 
@@ -593,8 +935,7 @@ class ConfluenceImporter:
                 logger.info("No databases metadata found, skipping database import")
                 return
 
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                databases = json.load(f)
+            databases = _load_shared_json(metadata_file)
 
             if not databases:
                 logger.info("No databases to import")
@@ -607,66 +948,39 @@ class ConfluenceImporter:
 
             space_id = self.target_space_id or (
                 self.client.get_space_id_v2(space_key)
-                or self.client.get_space_id(space_key)
+                or self._get_space_id(space_key)
             )
             if not space_id:
                 logger.warning(f"Could not get space ID for {space_key}, skipping database import")
                 return
 
-            # Import root databases first (no parentId), then children
-            root_databases = [d for d in databases if not d.get('parentId')]
-            child_databases = [d for d in databases if d.get('parentId')]
-
-            for database in root_databases:
-                try:
-                    self._import_single_database(database, space_id, None)
-                except Exception as e:
-                    error_msg = f"Failed to import database stub '{database.get('title', 'Unknown')}': {e}"
-                    logger.warning(error_msg)
-                    self.import_stats['errors'].append(error_msg)
-
-            # Multi-pass for nested databases (databases inside folders or under other databases)
-            max_passes = 10
-            remaining = child_databases.copy()
-
-            for pass_num in range(max_passes):
-                if not remaining:
-                    break
-
-                imported_in_pass = []
-
-                for database in remaining:
-                    old_parent_id = database.get('parentId')
-
-                    # Resolve parent from any of our mappings
-                    new_parent_id = (
-                        self.database_mapping.get(old_parent_id)
-                        or self.folder_mapping.get(old_parent_id)
-                        or self.page_mapping.get(old_parent_id)
-                    )
-
-                    if new_parent_id:
-                        try:
-                            self._import_single_database(database, space_id, new_parent_id)
-                            imported_in_pass.append(database)
-                        except Exception as e:
-                            error_msg = f"Failed to import database stub '{database.get('title', 'Unknown')}': {e}"
-                            logger.warning(error_msg)
-                            self.import_stats['errors'].append(error_msg)
-                            imported_in_pass.append(database)
+            self._index_existing_containers(space_id, space_key)
+
+            def resolve_parent(database):
+                # Root databases have no parentId; nested ones (inside folders
+                # or under other databases) resolve from any of our mappings
+                old_parent_id = database.get('parentId')
+                if not old_parent_id:
+                    return True, None
+                new_parent_id = (
+                    self.database_mapping.get(old_parent_id)
+                    or self.folder_mapping.get(old_parent_id)
+                    or self.page_mapping.get(old_parent_id)
+                )
+                return bool(new_parent_id), new_parent_id
 
-                for database in imported_in_pass:
-                    remaining.remove(database)
+            remaining = self._create_by_level(
+                databases, 'database stub', resolve_parent,
+                lambda database, parent_id: self._import_single_database(database, space_id, parent_id)
+            )
 
-                if not imported_in_pass:
-                    for database in remaining:
-                        error_msg = (
-                            f"Skipped database stub '{database.get('title', 'Unknown')}' "
-                            f"due to missing parent (ID: {database.get('parentId')})"
-                        )
-                        logger.warning(error_msg)
-                        self.import_stats['errors'].append(error_msg)
-                    break
+            for database in remaining:
+                error_msg = (
+                    f"Skipped database stub '{database.get('title', 'Unknown')}' "
+                    f"due to missing parent (ID: {database.get('parentId')})"
+                )
+                logger.warning(error_msg)
+                self.import_stats['errors'].append(error_msg)
 
             logger.info(f"Imported {self.import_stats['databases_imported']} database stubs")
 
@@ -687,6 +1001,20 @@ class ConfluenceImporter:
         old_database_id = database.get('id')
         database_title = database.get('title', 'Untitled Database')
 
+        existing_id = self._existing_databases.get(
+            (str(parent_id) if parent_id else None, database_title)
+        )
+        if existing_id:
+            if old_database_id:
+                self.database_mapping[old_database_id] = existing_id
+            with self._stats_lock:
+                self.import_stats['databases_reused'] += 1
+            logger.info(
+                f"Reusing existing database stub: '{database_title}' "
+                f"(old ID: {old_database_id}, ID: {existing_id})"
+            )
+            return
+
         try:
             new_database = self.client.create_database(space_id, database_title, parent_id)
             new_database_id = new_database.get('id')
@@ -694,7 +1022,8 @@ class ConfluenceImporter:
             if old_database_id and new_database_id:
                 self.database_mapping[old_database_id] = new_database_id
 
-            self.import_stats['databases_imported'] += 1
+            with self._stats_lock:
+                self.import_stats['databases_imported'] += 1
             logger.info(
                 f"Created database stub: '{database_title}' "
                 f"(old ID: {old_database_id}, new ID: {new_database_id})"
@@ -713,10 +1042,9 @@ class ConfluenceImporter:
                 content_type: Content type (page or blogpost)
             """
             # Get list of page files
-            page_files = []
-            for filename in os.listdir(pages_dir):
-                if filename.endswith('.html') and not filename.endswith('_metadata.json'):
-                    page_files.append(filename)
+            with os.scandir(pages_dir) as entries:
+                page_files = [entry.name for entry in entries
+                              if entry.name.endswith('.html') and entry.is_file()]
             
             if not page_files:
                 logger.warning(f"No {content_type} files found in {pages_dir}")
@@ -745,244 +1073,354 @@ class ConfluenceImporter:
             # Import pages with progress tracking using multi-pass strategy
             max_workers = self.config.get('max_workers', 3)  # Lower for imports to avoid conflicts
             
-            with tqdm(total=len(sorted_pages), desc=f"Importing {content_type}s") as pbar:
-                # Import root pages first (no parents)
-                root_pages = [p for p in sorted_pages if not p.get('metadata', {}).get('ancestors')]
+            with tqdm(total=len(sorted_pages), desc=f"Importing {content_type}s", mininterval=0.5) as pbar:
+                # Split root pages (no parents) from child pages in one pass
+                root_pages = []
+                child_pages = []
+                for page_info in sorted_pages:
+                    if page_info.get('metadata', {}).get('ancestors'):
+                        child_pages.append(page_info)
+                    else:
+                        root_pages.append(page_info)
                 
-                logger.info(f"Found {len(root_pages)} root pages (no ancestors) to import first")
-                logger.debug(f"Root page titles: {[p.get('metadata', {}).get('title', p['filename']) for p in root_pages[:10]]}")
+                # Import root pages first
                 
-                for page_info in root_pages:
-                    try:
-                        result_id = self._import_single_page(page_info, pages_dir, space_key, content_type)
-                        old_id = page_info.get('metadata', {}).get('id')
-                        if old_id and old_id in self.page_mapping:
-                            logger.debug(f"Mapped root page: {old_id} -> {self.page_mapping[old_id]}")
-                    except Exception as e:
-                        error_msg = f"Failed to import {content_type} '{page_info['filename']}': {e}"
-                        logger.error(error_msg)
-                        self.import_stats['errors'].append(error_msg)
-                    finally:
-                        pbar.update(1)
+                logger.info(f"Found {len(root_pages)} root pages (no ancestors) to import first")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Root page titles: %s",
+                                 [p.get('metadata', {}).get('title', p['filename']) for p in root_pages[:10]])
                 
-                # Import child pages using multi-pass strategy
-                # Some pages may need their parents to be imported first
-                child_pages = [p for p in sorted_pages if p.get('metadata', {}).get('ancestors')]
+                self._import_page_batch(root_pages, pages_dir, space_key, content_type,
+                                        max_workers, pbar)
                 
-                logger.info(f"Starting multi-pass import: {len(child_pages)} child pages to import")
+                # Import child pages. They are already ordered parents-first,
+                # and a page whose parent is still in flight waits for it, so a
+                # single batch places every page whose parent can be resolved.
+                logger.info(f"Importing {len(child_pages)} child pages")
                 
-                max_passes = 10  # Prevent infinite loops
-                remaining_pages = child_pages.copy()
                 failed_pages = []  # Track pages that failed to import
                 
-                for pass_num in range(max_passes):
-                    if not remaining_pages:
-                        break
-                    
-                    logger.debug(f"Multi-pass import: Pass {pass_num + 1}, {len(remaining_pages)} pages remaining")
-                    logger.debug(f"Page mapping currently has {len(self.page_mapping)} entries")
+                # Failed pages still count as processed, to avoid retrying them
+                imported_pages, remaining_pages = self._import_page_batch(
+                    child_pages, pages_dir, space_key, content_type,
+                    max_workers, pbar, failed_pages
+                )
+                logger.info(f"Imported {len(imported_pages)} child pages, {len(remaining_pages)} pages still waiting for parents")
+                
+                if remaining_pages:
+                    logger.warning(f"Could not import {len(remaining_pages)} {content_type}s due to missing parent references")
                     
-                    imported_in_pass = []
-                    skipped_in_pass = []
+                    # Log current state of page_mapping for diagnostics
+                    logger.info(f"Current page_mapping contains {len(self.page_mapping)} entries")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Page mapping IDs: %s...", list(itertools.islice(self.page_mapping, 20)))  # Show first 20 for diagnostics
                     
+                    # Log detailed info about remaining pages and their missing parents
+                    missing_parent_ids = {
+                        (page_info.get('metadata', {}).get('ancestors') or [{}])[-1].get('id', 'unknown')
+                        for page_info in remaining_pages
+                    } - {'unknown'}
                     for page_info in remaining_pages:
-                        # Check if parent is available
                         metadata = page_info.get('metadata', {})
-                        parent_available = self._is_parent_available(metadata, space_key)
+                        ancestors = metadata.get('ancestors', [])
+                        parent_info = ancestors[-1] if ancestors else {}
+                        parent_id = parent_info.get('id', 'unknown')
+                        parent_title = parent_info.get('title', 'unknown')
                         
-                        if parent_available:
-                            try:
-                                self._import_single_page(page_info, pages_dir, space_key, content_type)
-                                imported_in_pass.append(page_info)
-                            except Exception as e:
-                                error_msg = f"Failed to import {content_type} '{page_info['filename']}': {e}"
-                                logger.error(error_msg)
-                                logger.debug(f"Error details for {page_info['filename']}: {e}", exc_info=True)
-                                self.import_stats['errors'].append(error_msg)
-                                # Track failed pages separately - don't remove them from queue yet
-                                failed_pages.append({'page_info': page_info, 'error': str(e), 'pass': pass_num + 1})
-                                imported_in_pass.append(page_info)  # Still remove from remaining to avoid infinite retries
-                            finally:
-                                pbar.update(1)
-                        else:
-                            # Parent not available yet, try in next pass
-                            skipped_in_pass.append(page_info)
-                            metadata = page_info.get('metadata', {})
-                            ancestors = metadata.get('ancestors', [])
-                            if ancestors:
-                                parent_info = ancestors[-1]
-                                parent_id = parent_info.get('id', 'unknown')
-                                logger.debug(f"Skipping {page_info['filename']} in pass {pass_num + 1} - waiting for parent ID: {parent_id}")
+                        # Check if parent exists in export but wasn't imported
+                        parent_known = parent_id != 'unknown'
+                        parent_in_mapping = parent_known and parent_id in self.page_mapping
+                        parent_in_folder_mapping = parent_known and parent_id in self.folder_mapping
+                        
+                        error_msg = f"Skipped {content_type} '{page_info['filename']}' (title: '{metadata.get('title', 'unknown')}') - parent '{parent_title}' (ID: {parent_id}) not found in page_mapping (checked: page_mapping={parent_in_mapping}, folder_mapping={parent_in_folder_mapping})"
+                        logger.warning(error_msg)
+                        self.import_stats['errors'].append(error_msg)
+                        pbar.update(1)
+                    
+                    # Log analysis of missing parent IDs
+                    logger.error("Analysis: %d unique parent IDs were referenced but not found in mappings",
+                                 len(missing_parent_ids))
+                    logger.error("Missing parent IDs: %s", list(itertools.islice(missing_parent_ids, 20)))  # Show first 20
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Available page_mapping IDs (sample): %s", list(itertools.islice(self.page_mapping, 20)))
                     
-                    # Remove successfully processed pages
-                    remaining_pages = skipped_in_pass
+                    # Log summary of failed pages if any
+                    if failed_pages:
+                        logger.error(f"Additionally, {len(failed_pages)} pages failed to import due to errors:")
+                        for failed in failed_pages:
+                            logger.error(f"  - {failed['page_info']['filename']}: {failed['error']}")
                     
-                    # Log progress of this pass
-                    if imported_in_pass:
-                        logger.info(f"Pass {pass_num + 1}: Successfully imported {len(imported_in_pass)} pages, {len(skipped_in_pass)} pages still waiting for parents")
+                    # Log diagnostic info about what WAS successfully imported
+                    logger.info(f"Successfully imported pages so far: {self.import_stats['pages_imported']} pages, {self.import_stats['pages_updated']} updated, {self.import_stats['pages_skipped']} skipped")
                     
-                    # If no pages were imported in this pass, we can't make progress
-                    if not imported_in_pass:
-                        logger.warning(f"Could not import {len(remaining_pages)} {content_type}s due to missing parent references after {pass_num + 1} passes")
+                    # Import orphaned pages with synthetic parent pages
+                    # Group orphaned pages by their missing parent ID
+                    orphaned_by_parent = {}
+                    for page_info in remaining_pages:
+                        ancestors = page_info.get('metadata', {}).get('ancestors', [])
+                        if ancestors:
+                            parent_info = ancestors[-1]
+                            parent_id = parent_info.get('id', 'unknown')
+                        else:
+                            # No ancestors - import as root page
+                            parent_info = None
+                            parent_id = 'no_parent'
                         
-                        # Log current state of page_mapping for diagnostics
-                        logger.info(f"Current page_mapping contains {len(self.page_mapping)} entries")
-                        logger.debug(f"Page mapping IDs: {list(self.page_mapping.keys())[:20]}...")  # Show first 20 for diagnostics
+                        group = orphaned_by_parent.get(parent_id)
+                        if group is None:
+                            # The first page seen names the group's parent
+                            parent_title = (parent_info.get('title', f'Missing Parent ({parent_id})')
+                                            if parent_info is not None else None)
+                            group = orphaned_by_parent[parent_id] = {
+                                'title': parent_title,
+                                'pages': []
+                            }
+                        group['pages'].append(page_info)
+                    
+                    logger.warning(f"Importing {len(remaining_pages)} orphaned pages grouped under {len(orphaned_by_parent)} synthetic parent pages")
+                    
+                    # Parse every orphan's HTML up front on all cores; the imports
+                    # below are then left with just the API calls
+                    extracted_content = self._extract_pages_content(
+                        [page_info['html_path'] for page_info in remaining_pages])
+                    
+                    def import_orphan(page_info, parent_label, parent_page_id):
+                        metadata = page_info.get('metadata', {})
+                        page_title = metadata.get('title', page_info['filename'])
+                        extracted = extracted_content.get(page_info['html_path'])
+                        if parent_label is None:
+                            # Import pages without ancestors directly as root pages
+                            self._import_single_page(page_info, pages_dir, space_key, content_type, extracted)
+                            logger.info("Imported page '%s' as root page (no ancestors)", page_title)
+                        elif parent_page_id:
+                            # The old parent ID is now mapped to parent_page_id in page_mapping
+                            # so _import_single_page will find it via _find_parent_page
+                            self._import_single_page(page_info, pages_dir, space_key, content_type, extracted)
+                            logger.info("Imported orphaned page '%s' under %s", page_title, parent_label)
+                        else:
+                            # Parent creation failed - import as root page
+                            original_ancestors = metadata.get('ancestors', [])
+                            metadata['ancestors'] = []
+                            try:
+                                self._import_single_page(page_info, pages_dir, space_key, content_type, extracted)
+                            finally:
+                                metadata['ancestors'] = original_ancestors
+                            logger.info("Imported orphaned page '%s' as root page (synthetic parent creation failed)",
+                                        page_title)
+                    
+                    # A group's missing parent may itself be an orphan in another group
+                    # (a whole subtree left over from a partial export).  Handle the
+                    # group holding that page first, so the page can be waited for
+                    # below instead of racing a placeholder for its page_mapping entry.
+                    orphan_group_of = {}
+                    for parent_id, group_info in orphaned_by_parent.items():
+                        for page_info in group_info['pages']:
+                            old_page_id = page_info.get('metadata', {}).get('id')
+                            if old_page_id:
+                                orphan_group_of[str(old_page_id)] = parent_id
+                    ordered_groups, cyclic_groups = self._toposort_by_parent(
+                        list(orphaned_by_parent.items()),
+                        lambda group: group[0],
+                        lambda group: orphan_group_of.get(str(group[0]))
+                    )
+                    
+                    # Create synthetic parent pages one group at a time, and import
+                    # each group's pages concurrently once its parent exists
+                    orphan_futures = {}
+                    orphan_page_futures = {}  # Old page ID -> future importing that page
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        def submit_orphans(group_info, parent_label, parent_page_id, label):
+                            for page_info in group_info['pages']:
+                                future = executor.submit(import_orphan, page_info, parent_label, parent_page_id)
+                                orphan_futures[future] = (page_info, label)
+                                old_page_id = page_info.get('metadata', {}).get('id')
+                                if old_page_id:
+                                    orphan_page_futures[str(old_page_id)] = future
                         
-                        # Log detailed info about remaining pages and their missing parents
-                        missing_parent_ids = set()
-                        for page_info in remaining_pages:
-                            metadata = page_info.get('metadata', {})
-                            ancestors = metadata.get('ancestors', [])
-                            parent_info = ancestors[-1] if ancestors else {}
-                            parent_id = parent_info.get('id', 'unknown')
-                            parent_title = parent_info.get('title', 'unknown')
+                        for parent_id, group_info in ordered_groups + cyclic_groups:
+                            if parent_id == 'no_parent':
+                                submit_orphans(group_info, None, None, 'page')
+                                continue
                             
-                            # Track missing parent IDs
-                            if parent_id != 'unknown':
-                                missing_parent_ids.add(parent_id)
+                            parent_title = group_info['title']
                             
-                            # Check if parent exists in export but wasn't imported
-                            parent_in_mapping = parent_id in self.page_mapping if parent_id != 'unknown' else False
-                            parent_in_folder_mapping = parent_id in self.folder_mapping if parent_id != 'unknown' else False
+                            # If the missing parent is being imported as an orphan, wait
+                            # for it and put every child under the real page
+                            parent_future = orphan_page_futures.get(str(parent_id))
+                            if parent_future is not None:
+                                concurrent.futures.wait([parent_future])
+                                parent_page_id = self.page_mapping.get(parent_id)
+                                if parent_page_id:
+                                    submit_orphans(group_info, f"parent '{parent_title}'",
+                                                   parent_page_id, 'orphaned page')
+                                    continue
                             
-                            error_msg = f"Skipped {content_type} '{page_info['filename']}' (title: '{metadata.get('title', 'unknown')}') - parent '{parent_title}' (ID: {parent_id}) not found in page_mapping (checked: page_mapping={parent_in_mapping}, folder_mapping={parent_in_folder_mapping})"
-                            logger.warning(error_msg)
-                            self.import_stats['errors'].append(error_msg)
-                            pbar.update(1)
-                        
-                        # Log analysis of missing parent IDs
-                        logger.error(f"Analysis: {len(missing_parent_ids)} unique parent IDs were referenced but not found in mappings")
-                        logger.error(f"Missing parent IDs: {list(missing_parent_ids)[:20]}")  # Show first 20
-                        logger.info(f"Available page_mapping IDs (sample): {list(self.page_mapping.keys())[:20]}")
-                        
-                        # Log summary of failed pages if any
-                        if failed_pages:
-                            logger.error(f"Additionally, {len(failed_pages)} pages failed to import due to errors:")
-                            for failed in failed_pages:
-                                logger.error(f"  - {failed['page_info']['filename']}: {failed['error']} (pass {failed['pass']})")
-                        
-                        # Log diagnostic info about what WAS successfully imported
-                        logger.info(f"Successfully imported pages in this multi-pass cycle: {self.import_stats['pages_imported']} pages, {self.import_stats['pages_updated']} updated, {self.import_stats['pages_skipped']} skipped before multi-pass")
-                        
-                        # Import orphaned pages with synthetic parent pages
-                        # Group orphaned pages by their missing parent ID
-                        orphaned_by_parent = {}
-                        for page_info in remaining_pages:
-                            metadata = page_info.get('metadata', {})
-                            ancestors = metadata.get('ancestors', [])
-                            if ancestors:
-                                parent_info = ancestors[-1]
-                                parent_id = parent_info.get('id', 'unknown')
-                                parent_title = parent_info.get('title', f'Missing Parent ({parent_id})')
-                                
-                                if parent_id not in orphaned_by_parent:
-                                    orphaned_by_parent[parent_id] = {
-                                        'title': parent_title,
-                                        'pages': []
-                                    }
-                                orphaned_by_parent[parent_id]['pages'].append(page_info)
-                            else:
-                                # No ancestors - import as root page
-                                if 'no_parent' not in orphaned_by_parent:
-                                    orphaned_by_parent['no_parent'] = {
-                                        'title': None,
-                                        'pages': []
-                                    }
-                                orphaned_by_parent['no_parent']['pages'].append(page_info)
-                        
-                        logger.warning(f"Importing {len(remaining_pages)} orphaned pages grouped under {len(orphaned_by_parent)} synthetic parent pages")
-                        
-                        # Create synthetic parent pages and import orphaned pages under them
-                        for parent_id, group_info in orphaned_by_parent.items():
-                            if parent_id == 'no_parent':
-                                # Import pages without ancestors directly as root pages
-                                for page_info in group_info['pages']:
-                                    try:
-                                        metadata = page_info.get('metadata', {})
-                                        self._import_single_page(page_info, pages_dir, space_key, content_type)
-                                        logger.info(f"Imported page '{metadata.get('title', page_info['filename'])}' as root page (no ancestors)")
-                                    except Exception as e:
-                                        error_msg = f"Failed to import page '{page_info['filename']}': {e}"
-                                        logger.error(error_msg)
-                                        self.import_stats['errors'].append(error_msg)
-                                    finally:
-                                        pbar.update(1)
-                            else:
-                                # Create synthetic parent page for this group
-                                parent_title = group_info['title']
-                                synthetic_parent_id = None
+                            # Create synthetic parent page for this group
+                            synthetic_parent_id = None
+                            
+                            try:
+                                # Escape user-controlled data to prevent XSS
+                                escaped_parent_title = html.escape(parent_title)
+                                escaped_parent_id = html.escape(str(parent_id))
                                 
-                                try:
-                                    # Escape user-controlled data to prevent XSS
-                                    escaped_parent_title = html.escape(parent_title)
-                                    escaped_parent_id = html.escape(str(parent_id))
-                                    
-                                    # Create a placeholder parent page with informative content
-                                    placeholder_content = f"""<p><strong>Note:</strong> This is a placeholder page created during import.</p>
+                                # Create a placeholder parent page with informative content
+                                placeholder_parts = [f"""<p><strong>Note:</strong> This is a placeholder page created during import.</p>
 <p>The original parent page or folder named <strong>"{escaped_parent_title}"</strong> (ID: {escaped_parent_id}) was not included in the export. 
 This placeholder was created to preserve the organizational structure of the following {len(group_info['pages'])} child pages:</p>
-<ul>"""
-                                    for page_info_item in group_info['pages']:
-                                        page_title_item = page_info_item.get('metadata', {}).get('title', page_info_item['filename'])
-                                        escaped_page_title = html.escape(page_title_item)
-                                        placeholder_content += f"\n<li>{escaped_page_title}</li>"
-                                    placeholder_content += """
+<ul>"""]
+                                escape = html.escape
+                                placeholder_parts.extend(
+                                    f"\n<li>{escape(page_info_item.get('metadata', {}).get('title', page_info_item['filename']))}</li>"
+                                    for page_info_item in group_info['pages']
+                                )
+                                placeholder_parts.append("""
 </ul>
-<p>You can reorganize these pages or replace this placeholder with the actual parent content.</p>"""
-                                    
-                                    # Create the synthetic parent page
-                                    synthetic_parent = self.client.create_page(
-                                        space_key, 
-                                        f"[Recovered] {parent_title}", 
-                                        placeholder_content, 
-                                        None  # Create as root page
-                                    )
-                                    synthetic_parent_id = synthetic_parent['id']
-                                    
-                                    # Map the old parent ID to the new synthetic parent ID
-                                    self.page_mapping[parent_id] = synthetic_parent_id
-                                    
-                                    logger.info(f"Created synthetic parent page '[Recovered] {parent_title}' for {len(group_info['pages'])} orphaned pages")
+<p>You can reorganize these pages or replace this placeholder with the actual parent content.</p>""")
+                                placeholder_content = ''.join(placeholder_parts)
+                                
+                                # Create the synthetic parent page
+                                synthetic_parent = self.client.create_page(
+                                    space_key, 
+                                    f"[Recovered] {parent_title}", 
+                                    placeholder_content, 
+                                    None  # Create as root page
+                                )
+                                synthetic_parent_id = synthetic_parent['id']
+                                
+                                # Map the old parent ID to the new synthetic parent ID
+                                self.page_mapping[parent_id] = synthetic_parent_id
+                                
+                                logger.info("Created synthetic parent page '[Recovered] %s' for %d orphaned pages",
+                                            parent_title, len(group_info['pages']))
+                                with self._stats_lock:
                                     self.import_stats['pages_imported'] += 1
-                                    
-                                except Exception as e:
-                                    error_msg = f"Failed to create synthetic parent page '{parent_title}': {e}"
-                                    logger.error(error_msg)
-                                    self.import_stats['errors'].append(error_msg)
-                                    # Fall back to importing children as root pages
-                                    synthetic_parent_id = None
                                 
-                                # Now import child pages under the synthetic parent (or as root if parent creation failed)
-                                for page_info in group_info['pages']:
-                                    try:
-                                        metadata = page_info.get('metadata', {})
-                                        original_ancestors = metadata.get('ancestors', [])
-                                        
-                                        if synthetic_parent_id:
-                                            # Parent was created - update ancestors to reference synthetic parent
-                                            # The old parent ID is now mapped to synthetic_parent_id in page_mapping
-                                            # so _import_single_page will find it via _find_parent_page
-                                            self._import_single_page(page_info, pages_dir, space_key, content_type)
-                                            logger.info(f"Imported orphaned page '{metadata.get('title', page_info['filename'])}' under synthetic parent '[Recovered] {parent_title}'")
-                                        else:
-                                            # Parent creation failed - import as root page
-                                            metadata['ancestors'] = []
-                                            self._import_single_page(page_info, pages_dir, space_key, content_type)
-                                            metadata['ancestors'] = original_ancestors
-                                            logger.info(f"Imported orphaned page '{metadata.get('title', page_info['filename'])}' as root page (synthetic parent creation failed)")
-                                    except Exception as e:
-                                        error_msg = f"Failed to import orphaned page '{page_info['filename']}': {e}"
-                                        logger.error(error_msg)
-                                        self.import_stats['errors'].append(error_msg)
-                                    finally:
-                                        pbar.update(1)
+                            except Exception as e:
+                                error_msg = f"Failed to create synthetic parent page '{parent_title}': {e}"
+                                logger.error(error_msg)
+                                self.import_stats['errors'].append(error_msg)
+                                # Fall back to importing children as root pages
+                                synthetic_parent_id = None
+                            
+                            # Now import child pages under the synthetic parent (or as root if parent creation failed)
+                            submit_orphans(group_info, f"synthetic parent '[Recovered] {parent_title}'",
+                                           synthetic_parent_id, 'orphaned page')
                         
-                        break
+                        for future in concurrent.futures.as_completed(orphan_futures):
+                            page_info, label = orphan_futures[future]
+                            try:
+                                future.result()
+                            except Exception as e:
+                                error_msg = f"Failed to import {label} '{page_info['filename']}': {e}"
+                                logger.error(error_msg)
+                                self.import_stats['errors'].append(error_msg)
+                            finally:
+                                pbar.update(1)
+        
+    def _import_page_batch(self, pages: List[Dict[str, Any]], pages_dir: str, space_key: str,
+                           content_type: str, max_workers: int, pbar: tqdm,
+                           failed_pages: Optional[List[Dict[str, Any]]] = None
+                           ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Import a batch of pages with up to max_workers imports in flight.
+        
+        A page is only submitted once its parent is available.  Pages whose
+        parent is itself still being imported in this batch wait for it and
+        are submitted as soon as it finishes; pages whose parent is
+        unavailable otherwise are returned to the caller.
+        
+        Args:
+            pages: Page info dictionaries, parents before children
+            pages_dir: Pages directory path
+            space_key: Target space key
+            content_type: Content type (page or blogpost)
+            max_workers: Maximum concurrent page imports
+            pbar: Progress bar, advanced once per attempted page
+            failed_pages: If given, failed imports are recorded here
+        
+        Returns:
+            Tuple of (processed pages, including failures; skipped pages)
+        """
+        processed = []
+        skipped = []
+        queue = deque(pages)
+        # Old IDs of pages in this batch that haven't finished yet, and the
+        # pages waiting on each of them as their parent
+        pending_ids = {p.get('metadata', {}).get('id') for p in pages}
+        waiting: Dict[Any, List[Dict[str, Any]]] = {}
+        in_flight: Dict[concurrent.futures.Future, Dict[str, Any]] = {}
+        # The mappings are only ever updated in place, so local aliases
+        # stay current while workers add to them
+        page_mapping = self.page_mapping
+        folder_mapping = self.folder_mapping
+        database_mapping = self.database_mapping
+        
+        def release(page_info: Dict[str, Any]) -> None:
+            # Let pages waiting on this one be checked again
+            old_id = page_info.get('metadata', {}).get('id')
+            pending_ids.discard(old_id)
+            queue.extendleft(reversed(waiting.pop(old_id, [])))
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while queue or in_flight:
+                while queue and len(in_flight) < max_workers:
+                    page_info = queue.popleft()
+                    metadata = page_info.get('metadata', {})
+                    ancestors = metadata.get('ancestors', [])
+                    parent_id = ancestors[-1].get('id', 'unknown') if ancestors else None
+                    
+                    # Mapped parents need only a dict hit; the full check
+                    # (title search, deferred folders) is for the rest
+                    parent_mapped = (parent_id is None
+                                     or parent_id in page_mapping
+                                     or parent_id in folder_mapping
+                                     or parent_id in database_mapping)
+                    
+                    if not parent_mapped and parent_id in pending_ids:
+                        waiting.setdefault(parent_id, []).append(page_info)
+                    elif parent_mapped or self._is_parent_available(metadata, space_key):
+                        future = executor.submit(self._import_single_page, page_info,
+                                                 pages_dir, space_key, content_type)
+                        in_flight[future] = page_info
+                    else:
+                        # Parent not available, leave it to the caller
+                        skipped.append(page_info)
+                        logger.debug("Skipping %s - parent ID %s not available", page_info['filename'], parent_id)
+                        release(page_info)
+                
+                if not in_flight:
+                    continue
+                
+                done, _ = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    page_info = in_flight.pop(future)
+                    try:
+                        future.result()
+                    except Exception as e:
+                        error_msg = f"Failed to import {content_type} '{page_info['filename']}': {e}"
+                        logger.error(error_msg)
+                        logger.debug("Error details for %s: %s", page_info['filename'], e, exc_info=True)
+                        self.import_stats['errors'].append(error_msg)
+                        if failed_pages is not None:
+                            failed_pages.append({'page_info': page_info, 'error': str(e)})
+                    finally:
+                        pbar.update(1)
+                    processed.append(page_info)
+                    release(page_info)
+        
+        # Anything still waiting has a parent that was itself left waiting
+        for waiting_pages in waiting.values():
+            skipped.extend(waiting_pages)
         
+        return processed, skipped
+    
     def _load_pages_metadata(self, pages_dir: str, page_files: List[str]) -> List[Dict[str, Any]]:
         """Load metadata for all pages.
         
+        The metadata files are small and independent, so they are read on a
+        thread pool; the results keep the order of page_files.
+        
         Args:
             pages_dir: Pages directory path
             page_files: List of page filenames
@@ -990,36 +1428,42 @@ This placeholder was created to preserve the organizational structure of the fol
         Returns:
             List of page information dictionaries
         """
-        pages_info = []
+        if not page_files:
+            return []
         
-        for filename in page_files:
-            try:
-                # Try to load corresponding metadata file
-                base_name = os.path.splitext(filename)[0]
-                metadata_file = os.path.join(pages_dir, f"{base_name}_metadata.json")
-                
-                page_info = {
-                    'filename': filename,
-                    'html_path': os.path.join(pages_dir, filename),
-                    'metadata': {}
-                }
-                
-                if os.path.exists(metadata_file):
-                    with open(metadata_file, 'r', encoding='utf-8') as f:
-                        page_info['metadata'] = json.load(f)
-                
-                pages_info.append(page_info)
-                
-            except Exception as e:
-                logger.warning(f"Could not load metadata for {filename}: {e}")
-                # Add page without metadata
-                pages_info.append({
-                    'filename': filename,
-                    'html_path': os.path.join(pages_dir, filename),
-                    'metadata': {}
-                })
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(page_files))) as executor:
+            return list(executor.map(
+                lambda filename: self._load_page_metadata(pages_dir, filename), page_files
+            ))
+    
+    def _load_page_metadata(self, pages_dir: str, filename: str) -> Dict[str, Any]:
+        """Load the metadata for one exported page.
+        
+        Args:
+            pages_dir: Pages directory path
+            filename: Page HTML filename
+            
+        Returns:
+            Page information dictionary, with empty metadata if the page's
+            metadata file is missing or unreadable
+        """
+        page_info = {
+            'filename': filename,
+            'html_path': os.path.join(pages_dir, filename),
+            'metadata': {}
+        }
         
-        return pages_info
+        # Try to load corresponding metadata file
+        base_name = os.path.splitext(filename)[0]
+        metadata_file = os.path.join(pages_dir, f"{base_name}_metadata.json")
+        try:
+            page_info['metadata'] = _load_json(metadata_file)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Could not load metadata for {filename}: {e}")
+        
+        return page_info
     
     def _sort_pages_by_hierarchy(self, pages_metadata: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Sort pages by hierarchy (parents before children).
@@ -1030,24 +1474,62 @@ This placeholder was created to preserve the organizational structure of the fol
         Returns:
             Sorted list of page metadata dictionaries
         """
-        # Create a simple sort: pages without ancestors first, then others
-        root_pages = []
-        child_pages = []
-        
-        for page_info in pages_metadata:
-            ancestors = page_info.get('metadata', {}).get('ancestors', [])
-            if not ancestors:
-                root_pages.append(page_info)
+        def parent_id(page_info):
+            ancestors = page_info.get('metadata', {}).get('ancestors')
+            return ancestors[-1].get('id') if ancestors else None
+        
+        ordered, cyclic = self._toposort_by_parent(
+            pages_metadata, lambda p: p.get('metadata', {}).get('id'), parent_id
+        )
+        # Pages caught in a parent cycle can never be placed parents-first;
+        # keep them at the end so they fall through to orphan handling.
+        return ordered + cyclic
+    
+    @staticmethod
+    def _toposort_by_parent(items: List[Dict[str, Any]], id_fn: Callable[[Dict[str, Any]], Any],
+                            parent_fn: Callable[[Dict[str, Any]], Any]
+                            ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Order items so each one comes after its parent.
+        
+        Items whose parent is not in the list are treated as roots, in their
+        original order; each item's children follow it breadth-first.  IDs
+        are compared as strings since exports mix numeric and string IDs.
+        
+        Args:
+            items: Items to order
+            id_fn: Returns an item's own ID
+            parent_fn: Returns an item's parent ID, or None
+        
+        Returns:
+            Tuple of (ordered items, items left over because of a parent cycle)
+        """
+        ids = {str(id_fn(item)) for item in items if id_fn(item) is not None}
+        children: Dict[str, List[Dict[str, Any]]] = {}
+        queue = deque()
+        
+        for item in items:
+            parent_id = parent_fn(item)
+            item_id = id_fn(item)
+            if (parent_id is not None and str(parent_id) in ids
+                    and str(parent_id) != str(item_id)):
+                children.setdefault(str(parent_id), []).append(item)
             else:
-                child_pages.append(page_info)
+                queue.append(item)
         
-        # Sort child pages by ancestor count (closer to root first)
-        child_pages.sort(key=lambda x: len(x.get('metadata', {}).get('ancestors', [])))
+        ordered = []
+        while queue:
+            item = queue.popleft()
+            ordered.append(item)
+            item_id = id_fn(item)
+            if item_id is not None:
+                queue.extend(children.pop(str(item_id), ()))
         
-        return root_pages + child_pages
+        cyclic = [item for waiting in children.values() for item in waiting]
+        return ordered, cyclic
     
     def _import_single_page(self, page_info: Dict[str, Any], pages_dir: str, 
-                          space_key: str, content_type: str) -> Optional[str]:
+                          space_key: str, content_type: str,
+                          extracted: Optional[Tuple[str, str]] = None) -> Optional[str]:
         """
         Import a single page and return its new page ID if created or updated.
     
@@ -1056,6 +1538,8 @@ This placeholder was created to preserve the organizational structure of the fol
             pages_dir (str): Directory containing page files.
             space_key (str): Confluence space key to import into.
             content_type (str): Type of content being imported (e.g., 'page').
+            extracted (Optional[Tuple[str, str]]): (title, content) already parsed from the
+                page's HTML file, to skip parsing it again.
     
         Returns:
             Optional[str]: The new page ID if the page was created or updated, otherwise None.
@@ -1076,7 +1560,7 @@ This placeholder was created to preserve the organizational structure of the fol
     
         try:
             # Extract title and content from HTML
-            title, content = self._extract_page_content(html_path)
+            title, content = self._extract_page_content(html_path, extracted)
     
             if not title:
                 title = os.path.splitext(filename)[0]
@@ -1088,12 +1572,13 @@ This placeholder was created to preserve the organizational structure of the fol
                 conflict_resolution = self.config.get('conflict_resolution', 'skip')
     
                 if conflict_resolution == 'skip':
-                    logger.info(f"Skipping existing {content_type}: {title}")
-                    self.import_stats['pages_skipped'] += 1
+                    logger.info("Skipping existing %s: %s", content_type, title)
+                    with self._stats_lock:
+                        self.import_stats['pages_skipped'] += 1
                     # Map old page ID to existing page ID for child page imports
                     if old_page_id and old_page_id != '':
                         self.page_mapping[old_page_id] = existing_page['id']
-                        logger.debug(f"Mapped skipped page ID: {old_page_id} -> {existing_page['id']}")
+                        logger.debug("Mapped skipped page ID: %s -> %s", old_page_id, existing_page['id'])
                     return existing_page['id']
     
                 elif conflict_resolution == 'overwrite':
@@ -1101,12 +1586,14 @@ This placeholder was created to preserve the organizational structure of the fol
                     updated_page = self.client.update_page(
                         existing_page['id'], title, content, version_number
                     )
-                    logger.info(f"Updated existing {content_type}: {title}")
-                    self.import_stats['pages_updated'] += 1
+                    self._remember_page(space_key, content_type, updated_page)
+                    logger.info("Updated existing %s: %s", content_type, title)
+                    with self._stats_lock:
+                        self.import_stats['pages_updated'] += 1
                     # Map old page ID to updated page ID for child page imports
                     if old_page_id and old_page_id != '':
                         self.page_mapping[old_page_id] = updated_page['id']
-                        logger.debug(f"Mapped updated page ID: {old_page_id} -> {updated_page['id']}")
+                        logger.debug("Mapped updated page ID: %s -> %s", old_page_id, updated_page['id'])
                     return updated_page['id']
     
                 elif conflict_resolution == 'update_newer':
@@ -1117,20 +1604,23 @@ This placeholder was created to preserve the organizational structure of the fol
                         updated_page = self.client.update_page(
                             existing_page['id'], title, content, version_number
                         )
-                        logger.info(f"Updated newer {content_type}: {title}")
-                        self.import_stats['pages_updated'] += 1
+                        self._remember_page(space_key, content_type, updated_page)
+                        logger.info("Updated newer %s: %s", content_type, title)
+                        with self._stats_lock:
+                            self.import_stats['pages_updated'] += 1
                         # Map old page ID to updated page ID for child page imports
                         if old_page_id and old_page_id != '':
                             self.page_mapping[old_page_id] = updated_page['id']
-                            logger.debug(f"Mapped updated (newer) page ID: {old_page_id} -> {updated_page['id']}")
+                            logger.debug("Mapped updated (newer) page ID: %s -> %s", old_page_id, updated_page['id'])
                         return updated_page['id']
                     else:
-                        logger.info(f"Skipping {content_type} (target is newer or same): {title}")
-                        self.import_stats['pages_skipped'] += 1
+                        logger.info("Skipping %s (target is newer or same): %s", content_type, title)
+                        with self._stats_lock:
+                            self.import_stats['pages_skipped'] += 1
                         # Map old page ID to existing page ID for child page imports
                         if old_page_id and old_page_id != '':
                             self.page_mapping[old_page_id] = existing_page['id']
-                            logger.debug(f"Mapped skipped (newer) page ID: {old_page_id} -> {existing_page['id']}")
+                            logger.debug("Mapped skipped (newer) page ID: %s -> %s", old_page_id, existing_page['id'])
                         return existing_page['id']
     
                 elif conflict_resolution == 'rename':
@@ -1144,13 +1634,15 @@ This placeholder was created to preserve the organizational structure of the fol
             # silently ignores the ancestor and creates the page at root level.
             # We correct this immediately after creation with a move call.
             new_page = self.client.create_page(space_key, title, content, parent_id)
-            logger.info(f"Created new {content_type}: {title}")
-            self.import_stats['pages_imported'] += 1
+            self._remember_page(space_key, content_type, new_page)
+            logger.info("Created new %s: %s", content_type, title)
+            with self._stats_lock:
+                self.import_stats['pages_imported'] += 1
 
             # Map old page ID to new page ID for child page imports
             if old_page_id and old_page_id != '':
                 self.page_mapping[old_page_id] = new_page['id']
-                logger.debug(f"Mapped page ID: {old_page_id} -> {new_page['id']}")
+                logger.debug("Mapped page ID: %s -> %s", old_page_id, new_page['id'])
 
             # If the intended parent is a folder or database, the v1 create_page
             # endpoint cannot place pages there directly.  Use the v1 move
@@ -1166,37 +1658,32 @@ This placeholder was created to preserve the organizational structure of the fol
             if self.v2_page_parents and old_page_id:
                 v2_info = self.v2_page_parents.get(str(old_page_id), {})
                 v2_parent_type = v2_info.get('parentType')
-                v2_old_parent_id = str(v2_info.get('parentId', '')) if v2_info.get('parentId') else None
+                v2_old_parent_id = v2_info.get('parentId')
                 if v2_parent_type == 'folder' and v2_old_parent_id:
-                    if v2_old_parent_id in self.folder_mapping:
-                        move_target_id = self.folder_mapping[v2_old_parent_id]
+                    # A folder missing from folder_mapping is a deferred folder; the
+                    # page is moved into it by _move_pages_to_deferred_folders
+                    move_target_id = self.folder_mapping.get(v2_old_parent_id)
+                    if move_target_id is not None:
                         move_parent_type = 'folder'
-                elif v2_parent_type == 'folder' and v2_old_parent_id:
-                    # parentType folder but not in folder_mapping — folder not yet imported
-                    logger.warning(
-                        f"Page '{title}' has a folder parent (ID: {v2_old_parent_id}) "
-                        f"that was not found in the folder mapping. "
-                        f"It may not have been exported/imported correctly."
-                    )
 
             # 2. v1 ancestors fallback (databases, and spaces without v2 parent data)
             if not move_target_id:
                 ancestors = metadata.get('ancestors', [])
                 old_parent_id = ancestors[-1].get('id') if ancestors else None
                 if old_parent_id:
-                    if old_parent_id in self.folder_mapping:
-                        move_target_id = self.folder_mapping[old_parent_id]
-                        move_parent_type = 'folder'
-                    elif old_parent_id in self.database_mapping:
-                        move_target_id = self.database_mapping[old_parent_id]
-                        move_parent_type = 'database'
+                    for parent_type, mapping in (('folder', self.folder_mapping),
+                                                 ('database', self.database_mapping)):
+                        move_target_id = mapping.get(old_parent_id)
+                        if move_target_id is not None:
+                            move_parent_type = parent_type
+                            break
 
             if move_target_id:
                 moved = self.client.move_content(
                     new_page['id'], move_target_id, position='append'
                 )
                 if moved:
-                    logger.info(f"Moved '{title}' into {move_parent_type} (ID: {move_target_id})")
+                    logger.info("Moved '%s' into %s (ID: %s)", title, move_parent_type, move_target_id)
                 else:
                     logger.warning(
                         f"Could not move '{title}' into {move_parent_type} "
@@ -1213,189 +1700,49 @@ This placeholder was created to preserve the organizational structure of the fol
             logger.error(f"Error importing {content_type} {filename}: {e}")
             raise
     
-    def _extract_div_content(self, html_content: str, class_name: str) -> str:
-        """Extract content from a div with the given class name, handling nested divs.
+    def _extract_pages_content(self, html_paths: List[str], processes: Optional[int] = None,
+                               chunksize: int = 16) -> Dict[str, Tuple[str, str]]:
+        """Parse many exported HTML files across worker processes.
         
-        This method uses HTMLParser to properly track div nesting depth and extract
-        the complete content of a div, even when it contains nested div elements or
-        text that contains '<div>' or '</div>' strings.
+        HTML parsing holds the GIL, so it only scales across cores with
+        processes.  Space key remapping is not applied here; pass each
+        result to _import_single_page as ``extracted`` and it is applied
+        there as usual.
         
         Args:
-            html_content: Full HTML content
-            class_name: CSS class name to search for
+            html_paths: Paths to HTML files
+            processes: Number of worker processes (defaults to the CPU count)
+            chunksize: Files sent to a worker per round trip
             
         Returns:
-            Content inside the div, or empty string if not found
+            (title, content) by path; paths that could not be parsed in a
+            worker are left out so they are retried (and logged) in-process
         """
-        class DivContentExtractor(HTMLParser):
-            """Extract content from a specific div by tracking nesting depth."""
-            
-            def __init__(self, target_class):
-                super().__init__()
-                self.target_class = target_class
-                self.in_target = False
-                self.depth = 0
-                self.content_parts = []
-                
-            def handle_starttag(self, tag, attrs):
-                if tag == 'div':
-                    # Check if this is the target div
-                    if not self.in_target:
-                        attrs_dict = dict(attrs)
-                        if 'class' in attrs_dict:
-                            classes = attrs_dict.get('class', '').split()
-                            if self.target_class in classes:
-                                self.in_target = True
-                                self.depth = 1
-                                return
-                    else:
-                        # We're already in target, track depth
-                        self.depth += 1
-                
-                # Capture the tag if we're in target div
-                if self.in_target:
-                    attrs_str = ''.join([f' {name}="{value}"' if value else f' {name}' 
-                                        for name, value in attrs])
-                    self.content_parts.append(f'<{tag}{attrs_str}>')
-            
-            def handle_endtag(self, tag):
-                if self.in_target and tag == 'div':
-                    self.depth -= 1
-                    
-                    if self.depth == 0:
-                        # We've closed the target div
-                        self.in_target = False
-                        return
-                
-                # Capture the tag if we're in target div
-                if self.in_target:
-                    self.content_parts.append(f'</{tag}>')
-            
-            def handle_data(self, data):
-                if self.in_target:
-                    self.content_parts.append(data)
-            
-            def handle_startendtag(self, tag, attrs):
-                if self.in_target:
-                    attrs_str = ''.join([f' {name}="{value}"' if value else f' {name}' 
-                                        for name, value in attrs])
-                    self.content_parts.append(f'<{tag}{attrs_str} />')
-            
-            def handle_comment(self, data):
-                if self.in_target:
-                    self.content_parts.append(f'<!--{data}-->')
-            
-            def handle_entityref(self, name):
-                if self.in_target:
-                    self.content_parts.append(f'&{name};')
-            
-            def handle_charref(self, name):
-                if self.in_target:
-                    self.content_parts.append(f'&#{name};')
-            
-            def unknown_decl(self, data):
-                """Handle CDATA sections which Confluence uses for code blocks."""
-                if self.in_target:
-                    # CDATA sections come as 'CDATA[content]'
-                    if data.startswith('CDATA['):
-                        cdata_content = data[6:-1] if data.endswith(']') else data[6:]
-                        self.content_parts.append(f'<![CDATA[{cdata_content}]]>')
-                    else:
-                        # Other declarations
-                        self.content_parts.append(f'<!{data}>')
-            
-            def get_content(self):
-                return ''.join(self.content_parts).strip()
+        if processes == 1 or len(html_paths) <= chunksize:
+            return {}
         
         try:
-            parser = DivContentExtractor(class_name)
-            parser.feed(html_content)
-            return parser.get_content()
+            with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+                results = executor.map(_read_page_content_in_worker, html_paths, chunksize=chunksize)
+                return {path: result for path, result in zip(html_paths, results) if result is not None}
         except Exception as e:
-            logger.warning(f"HTMLParser failed for class '{class_name}': {e}. Falling back to regex.")
-            # Fallback to the original regex-based approach if HTMLParser fails
-            return self._extract_div_content_regex(html_content, class_name)
-    
-    def _extract_div_content_regex(self, html_content: str, class_name: str) -> str:
-        """Fallback regex-based extraction (original implementation).
-        
-        Args:
-            html_content: Full HTML content
-            class_name: CSS class name to search for
-            
-        Returns:
-            Content inside the div, or empty string if not found
-        """
-        # Find the start of the target div
-        start_pattern = rf'<div[^>]*class="[^"]*{re.escape(class_name)}[^"]*"[^>]*>'
-        start_match = re.search(start_pattern, html_content, re.DOTALL)
-        
-        if not start_match:
-            return ""
-        
-        # Start searching after the opening tag
-        pos = start_match.end()
-        depth = 1
-        end_pos = pos
-        
-        # Track nested divs by counting opening and closing tags
-        while depth > 0 and end_pos < len(html_content):
-            # Find next div tag (opening or closing)
-            next_open = html_content.find('<div', end_pos)
-            next_close = html_content.find('</div>', end_pos)
-            
-            # If no more closing tags found, break
-            if next_close == -1:
-                break
-                
-            # If opening tag comes before closing tag (or no opening tag found)
-            if next_open != -1 and next_open < next_close:
-                depth += 1
-                end_pos = next_open + 1
-            else:
-                depth -= 1
-                if depth == 0:
-                    # Found the matching closing tag
-                    return html_content[pos:next_close].strip()
-                end_pos = next_close + 1
-        
-        # If we couldn't find matching closing tag, return what we found
-        return html_content[pos:].strip()
+            logger.warning(f"Parallel content extraction failed, parsing pages in-process: {e}")
+            return {}
     
-    def _extract_page_content(self, html_path: str) -> Tuple[str, str]:
+    def _extract_page_content(self, html_path: str,
+                              extracted: Optional[Tuple[str, str]] = None) -> Tuple[str, str]:
         """Extract title and content from HTML file.
         
         Args:
             html_path: Path to HTML file
+            extracted: (title, content) already parsed from html_path, e.g. by
+                _extract_pages_content; only space key remapping is applied
             
         Returns:
             Tuple of (title, content)
         """
         try:
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            # Extract title from HTML
-            title_match = re.search(r'<h1[^>]*class="page-title"[^>]*>(.*?)</h1>', html_content, re.DOTALL)
-            if not title_match:
-                title_match = re.search(r'<title>(.*?)</title>', html_content)
-            
-            title = title_match.group(1).strip() if title_match else ""
-            
-            # Extract content from page-content div
-            # Use proper div matching to handle nested divs correctly
-            content = self._extract_div_content(html_content, 'page-content')
-            
-            if not content:
-                # Fallback: extract body content
-                body_match = re.search(r'<body[^>]*>(.*?)</body>', html_content, re.DOTALL)
-                content = body_match.group(1).strip() if body_match else html_content
-            
-            # Clean up content - remove metadata div if present
-            # Simple approach: if metadata div exists, just use regex to remove it
-            # since we know it's a simple div at the end
-            metadata_pattern = r'<div[^>]*class="[^"]*metadata[^"]*"[^>]*>.*?</div>'
-            content = re.sub(metadata_pattern, '', content, flags=re.DOTALL)
+            title, content = extracted if extracted is not None else _read_page_content(html_path)
             
             # Apply space key remapping if enabled
             if self.content_rewriter:
@@ -1403,11 +1750,12 @@ This placeholder was created to preserve the organizational structure of the fol
                 
                 # Update cumulative statistics
                 if sum(stats.values()) > 0:
-                    self.remapping_stats['pages_with_changes'] += 1
-                    for key, value in stats.items():
-                        self.remapping_stats[key] += value
+                    with self._stats_lock:
+                        self.remapping_stats['pages_with_changes'] += 1
+                        for key, value in stats.items():
+                            self.remapping_stats[key] += value
                     
-                    logger.debug(f"Rewrote content for page from {html_path}: {stats}")
+                    logger.debug("Rewrote content for page from %s: %s", html_path, stats)
             
             return title, content
             
@@ -1418,6 +1766,9 @@ This placeholder was created to preserve the organizational structure of the fol
     def _find_existing_page(self, space_key: str, title: str, content_type: str) -> Optional[Dict[str, Any]]:
         """Find existing page with same title.
         
+        The space's content is listed once per run and indexed by title;
+        pages this importer creates or updates are added to the index.
+        
         Args:
             space_key: Space key
             title: Page title
@@ -1426,21 +1777,43 @@ This placeholder was created to preserve the organizational structure of the fol
         Returns:
             Existing page dictionary or None
         """
+        key = (space_key, content_type)
         try:
-            # Get all content of this type from space
-            content_list = self.client.get_all_space_content(space_key, content_type)
+            titles = self._existing_pages.get(key)
+            if titles is None:
+                # Workers can get here together; only one lists the space
+                with self._existing_pages_lock:
+                    titles = self._existing_pages.get(key)
+                    if titles is None:
+                        titles = {}
+                        # Callers only need id, title and version, so keep
+                        # the cached listing small
+                        for content_item in self.client.iter_space_content(
+                            space_key, content_type, expand='version'
+                        ):
+                            # The first match wins, as with the old linear scan
+                            titles.setdefault(content_item['title'], content_item)
+                        self._existing_pages[key] = titles
             
             # Look for exact title match
-            for content_item in content_list:
-                if content_item['title'] == title:
-                    return content_item
-            
-            return None
+            return titles.get(title)
             
         except Exception as e:
             logger.warning(f"Error searching for existing page '{title}': {e}")
             return None
     
+    def _remember_page(self, space_key: str, content_type: str, page: Dict[str, Any]) -> None:
+        """Record a page created or updated during this import in the title index.
+        
+        Args:
+            space_key: Space key
+            content_type: Content type, if the API response doesn't carry one
+            page: Page dictionary returned by the API
+        """
+        titles = self._existing_pages.get((space_key, page.get('type', content_type)))
+        if titles is not None and page.get('title'):
+            titles[page['title']] = page
+    
     def _is_parent_available(self, metadata: Dict[str, Any], space_key: str) -> bool:
         """Check if parent page is available for import.
         
@@ -1541,9 +1914,9 @@ This placeholder was created to preserve the organizational structure of the fol
         # Log at DEBUG to avoid alarming the user with expected warnings.
         if old_parent_id and old_parent_id in self._known_folder_ids:
             logger.debug(
-                f"Parent {old_parent_id} ({parent_info.get('title', '?')}) is a "
-                f"deferred folder — page will be placed at root temporarily and "
-                f"moved into the folder after _import_deferred_folders() completes"
+                "Parent %s (%s) is a deferred folder — page will be placed at root "
+                "temporarily and moved into the folder after _import_deferred_folders() completes",
+                old_parent_id, parent_info.get('title', '?')
             )
         else:
             logger.warning(f"Parent page not found for ancestors: {ancestors}")
@@ -1622,14 +1995,16 @@ This placeholder was created to preserve the organizational structure of the fol
                 for attempt in range(3):
                     try:
                         self.client.upload_attachment(page_id, file_path, f"Imported attachment: {filename}")
-                        self.import_stats['attachments_imported'] += 1
-                        logger.debug(f"Uploaded attachment: {filename}")
+                        with self._stats_lock:
+                            self.import_stats['attachments_imported'] += 1
+                        logger.debug("Uploaded attachment: %s", filename)
                         break
                     except requests.exceptions.HTTPError as e:
                         status = e.response.status_code if e.response is not None else None
                         if status and status >= 500 and attempt < 2:
                             wait = 2 ** (attempt + 1)  # 2s, 4s
-                            logger.debug(f"Attachment upload attempt {attempt + 1} failed (HTTP {status}) for {filename}, retrying in {wait}s")
+                            logger.debug("Attachment upload attempt %d failed (HTTP %s) for %s, retrying in %ss",
+                                         attempt + 1, status, filename, wait)
                             time.sleep(wait)
                         else:
                             error_msg = f"Failed to upload attachment {filename}: {e}"
@@ -1642,7 +2017,7 @@ This placeholder was created to preserve the organizational structure of the fol
                         self.import_stats['errors'].append(error_msg)
                         break
             
-            logger.info(f"Imported {len(attachment_files)} attachments for page: {page_title}")
+            logger.info("Imported %d attachments for page: %s", len(attachment_files), page_title)
             
         except Exception as e:
             error_msg = f"Failed to import attachments for page {page_title}: {e}"
@@ -1672,6 +2047,8 @@ This placeholder was created to preserve the organizational structure of the fol
                 'pages_skipped': self.import_stats['pages_skipped'],
                 'folders_imported': self.import_stats['folders_imported'],
                 'databases_imported': self.import_stats['databases_imported'],
+                'folders_reused': self.import_stats['folders_reused'],
+                'databases_reused': self.import_stats['databases_reused'],
                 'attachments_imported': self.import_stats['attachments_imported'],
                 'total_errors': len(self.import_stats['errors'])
             },
@@ -68,7 +68,7 @@ def init_config(ctx):
             ctx.obj['config'] = config_manager
             
             # Set up logging
-            log_config = config_manager.get_logging_config()
+            log_config = config_manager.logging
             log_level = 'DEBUG' if ctx.obj.get('verbose') else log_config.get('level', 'INFO')
             setup_logging(
                 log_level=log_level,
@@ -203,7 +203,7 @@ def config_validate(ctx):
     
     try:
         config_manager = ctx.obj['config']
-        confluence_config = config_manager.get_confluence_config()
+        confluence_config = config_manager.confluence
         
         print_colored("Validating configuration...", 'YELLOW')
         
@@ -267,9 +267,9 @@ def export(ctx, space, output, source_config):
         source_config_manager = ctx.obj['config']
     
     try:
-        confluence_config = source_config_manager.get_confluence_config()
-        export_config = source_config_manager.get_export_config()
-        general_config = source_config_manager.get_general_config()
+        confluence_config = source_config_manager.confluence
+        export_config = source_config_manager.export
+        general_config = source_config_manager.general
         
         # Display configuration being used
         print()
@@ -320,7 +320,8 @@ def export(ctx, space, output, source_config):
         # Create exporter and export
         print_colored(f"Starting export of space: {space_key}", 'CYAN')
         
-        exporter = ConfluenceExporter(client, export_config)
+        exporter = ConfluenceExporter(client, export_config,
+                                      max_workers=general_config.get('max_workers', 5))
         export_dir = exporter.export_space(space_key)
         
         print_colored(f"Export completed successfully!", 'GREEN')
@@ -447,9 +448,9 @@ def import_(ctx, export_dir, space, space_name, create_space, new_space_key, con
             print_colored("✓ Using default configuration for import", 'GREEN')
     
     try:
-        confluence_config = target_config_manager.get_confluence_config()
-        import_config = target_config_manager.get_import_config()
-        general_config = target_config_manager.get_general_config()
+        confluence_config = target_config_manager.confluence
+        import_config = target_config_manager.import_
+        general_config = target_config_manager.general
         
         # Display import configuration
         print()
@@ -462,7 +463,7 @@ def import_(ctx, export_dir, space, space_name, create_space, new_space_key, con
         print()
         
         # Set up logging from target config
-        log_config = target_config_manager.get_logging_config()
+        log_config = target_config_manager.logging
         log_level = log_config.get('level', 'INFO')
         setup_logging(
             log_level=log_level,
@@ -708,8 +709,8 @@ def list_spaces(ctx):
     
     try:
         config_manager = ctx.obj['config']
-        confluence_config = config_manager.get_confluence_config()
-        general_config = config_manager.get_general_config()
+        confluence_config = config_manager.confluence
+        general_config = config_manager.general
         config_file_used = ctx.obj.get('config_path') or 'config.yaml'
         
         # Display configuration being used
@@ -780,8 +781,8 @@ def clean_space(ctx, space_key, dry_run, target_config):
             init_config(ctx)
             config_manager = ctx.obj['config']
         
-        confluence_config = config_manager.get_confluence_config()
-        general_config = config_manager.get_general_config()
+        confluence_config = config_manager.confluence
+        general_config = config_manager.general
         
         # Display configuration being used
         print()
@@ -1236,11 +1237,11 @@ def sync(ctx, source_space, target_space, source_config, target_config, mode, dr
             target_config_manager = source_config_manager
         
         # Create API clients
-        source_confluence_config = source_config_manager.get_confluence_config()
-        source_general_config = source_config_manager.get_general_config()
+        source_confluence_config = source_config_manager.confluence
+        source_general_config = source_config_manager.general
         
-        target_confluence_config = target_config_manager.get_confluence_config()
-        target_general_config = target_config_manager.get_general_config()
+        target_confluence_config = target_config_manager.confluence
+        target_general_config = target_config_manager.general
         
         source_auth_config = source_confluence_config['auth']
         source_client = ConfluenceAPIClient(
@@ -1278,8 +1279,8 @@ def sync(ctx, source_space, target_space, source_config, target_config, mode, dr
         print_colored("Both connections successful!", 'GREEN')
         
         # Create synchronizer
-        export_config = source_config_manager.get_export_config()
-        import_config = target_config_manager.get_import_config()
+        export_config = source_config_manager.export
+        import_config = target_config_manager.import_
         
         synchronizer = ConfluenceSynchronizer(
             source_client, target_client, export_config, import_config
@@ -1374,11 +1375,11 @@ def compare(ctx, source_space, target_space, source_config, target_config, outpu
             target_config_manager = source_config_manager
         
         # Create API clients (same logic as sync command)
-        source_confluence_config = source_config_manager.get_confluence_config()
-        source_general_config = source_config_manager.get_general_config()
+        source_confluence_config = source_config_manager.confluence
+        source_general_config = source_config_manager.general
         
-        target_confluence_config = target_config_manager.get_confluence_config()
-        target_general_config = target_config_manager.get_general_config()
+        target_confluence_config = target_config_manager.confluence
+        target_general_config = target_config_manager.general
         
         source_auth_config = source_confluence_config['auth']
         source_client = ConfluenceAPIClient(
@@ -1412,8 +1413,8 @@ def compare(ctx, source_space, target_space, source_config, target_config, outpu
             sys.exit(1)
         
         # Create synchronizer and compare
-        export_config = source_config_manager.get_export_config()
-        import_config = target_config_manager.get_import_config()
+        export_config = source_config_manager.export
+        import_config = target_config_manager.import_
         
         synchronizer = ConfluenceSynchronizer(
             source_client, target_client, export_config, import_config
@@ -174,7 +174,7 @@ class ConfluenceSynchronizer:
         source_exporter = ConfluenceExporter(self.source_client, self.export_config)
         target_importer = ConfluenceImporter(self.target_client, self.import_config)
         
-        with tqdm(total=len(pages_to_sync), desc="Synchronizing pages") as pbar:
+        with tqdm(total=len(pages_to_sync), desc="Synchronizing pages", mininterval=0.5) as pbar:
             for page in pages_to_sync:
                 try:
                     self._sync_single_page(page, source_space_key, target_space_key, 
@@ -11,6 +11,19 @@ from urllib.parse import unquote
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by sanitize_filename, compiled once
+# URL-like names: uuid.ext followed by _ or ? then query params
+_URL_LIKE_FILENAME_RE = re.compile(r'^([^&?]+?\.[a-zA-Z0-9]{2,10})[\?_]')
+# Windows invalid chars: < > : " | ? * \ /
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"|?*\\/]')
+# Control characters (0-31) and DEL (127)
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1f\x7f]')
+_WINDOWS_RESERVED_NAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 'COM5',
+    'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 'LPT3', 'LPT4',
+    'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
+
 
 def sanitize_filename(filename: str, max_length: int = 255) -> str:
     """Sanitize filename for cross-platform compatibility.
@@ -34,7 +47,7 @@ def sanitize_filename(filename: str, max_length: int = 255) -> str:
     if ('&' in filename or '?' in filename) and '=' in filename:
         # Try to extract just the base filename with extension
         # Look for pattern like: uuid.ext followed by _ or ? then query params
-        match = re.match(r'^([^&?]+?\.[a-zA-Z0-9]{2,10})[\?_]', filename)
+        match = _URL_LIKE_FILENAME_RE.match(filename)
         if match:
             # Extract just the filename.ext part
             filename = match.group(1)
@@ -43,28 +56,21 @@ def sanitize_filename(filename: str, max_length: int = 255) -> str:
     # Remove or replace invalid characters
     # Windows invalid chars: < > : " | ? * \ /
     # Also remove control characters
-    invalid_chars = r'[<>:"|?*\\/]'
-    filename = re.sub(invalid_chars, '_', filename)
+    filename = _INVALID_FILENAME_CHARS_RE.sub('_', filename)
     
     # Replace ampersands and other problematic characters
     filename = filename.replace('&', '_')
     filename = filename.replace('=', '_')
     
     # Remove control characters (0-31) and DEL (127)
-    filename = re.sub(r'[\x00-\x1f\x7f]', '', filename)
+    filename = _CONTROL_CHARS_RE.sub('', filename)
     
     # Remove leading/trailing spaces and dots (Windows doesn't like these)
     filename = filename.strip(' .')
     
     # Handle reserved names on Windows
-    reserved_names = {
-        'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 'COM5',
-        'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 'LPT3', 'LPT4',
-        'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-    }
-    
     name_without_ext = os.path.splitext(filename)[0].upper()
-    if name_without_ext in reserved_names:
+    if name_without_ext in _WINDOWS_RESERVED_NAMES:
         filename = f"_{filename}"
     
     # Truncate if too long (keeping extension)
@@ -108,7 +114,7 @@ def create_directory_structure(base_path: str, space_key: str) -> str:
 
 
 def get_safe_page_filename(title: str, page_id: str, include_id: bool = False,
-                          extension: str = '.html') -> str:
+                          extension: str = '.html', safe_title: str = None) -> str:
     """Generate safe filename for a Confluence page.
     
     Args:
@@ -116,12 +122,14 @@ def get_safe_page_filename(title: str, page_id: str, include_id: bool = False,
         page_id: Page ID
         include_id: Whether to include page ID in filename
         extension: File extension
+        safe_title: sanitize_filename(title), if the caller already has it
         
     Returns:
         Safe filename for the page
     """
     # Start with sanitized title
-    safe_title = sanitize_filename(title)
+    if safe_title is None:
+        safe_title = sanitize_filename(title)
     
     # Add page ID if requested
     if include_id: